@@ -0,0 +1,180 @@
+"""Numeric kernels compiled with Numba when available, plain Python otherwise."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None  # type: ignore
+
+NUMBA_AVAILABLE = njit is not None
+
+
+def _jit(**options: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Apply ``numba.njit`` with *options* when Numba is installed."""
+
+    def decorate(func: Callable[..., Any]) -> Callable[..., Any]:
+        if njit is None:
+            return func
+        return njit(**options)(func)
+
+    return decorate
+
+
+def rotate_points(x: Any, y: Any, page_width: float, page_height: float, rot: int) -> Tuple[Any, Any]:
+    """Rotate points (scalars or NumPy arrays) by a normalised multiple of 90 degrees."""
+    if rot == 0:
+        return x, y
+    elif rot == 90:
+        return page_width - y, x
+    elif rot == 180:
+        return page_width - x, page_height - y
+    elif rot == 270:
+        return y, page_height - x
+    raise ValueError("Rotation must be 0/90/180/270 degrees.")
+
+
+def rotate_boxes(
+    x0: Any,
+    y0: Any,
+    x1: Any,
+    y1: Any,
+    page_width: float,
+    page_height: float,
+    rot: int,
+) -> Tuple[Any, Any, Any, Any]:
+    """Rotate axis-aligned boxes (scalars or NumPy arrays) by a normalised multiple of 90 degrees."""
+    if rot == 0:
+        return x0, y0, x1, y1
+    elif rot == 180:
+        return page_width - x1, page_height - y1, page_width - x0, page_height - y0
+    elif rot == 90:
+        return page_width - y1, x0, page_width - y0, x1
+    elif rot == 270:
+        return y0, page_height - x1, y1, page_height - x0
+    raise ValueError("Rotation must be 0/90/180/270 degrees.")
+
+
+rotate_point = _jit(cache=True)(rotate_points)
+rotate_box = _jit(cache=True)(rotate_boxes)
+
+
+@_jit(cache=True)
+def place_bbox(
+    x_px: float,
+    y_px: float,
+    w_px: float,
+    h_px: float,
+    image_x0: float,
+    image_y1: float,
+    scale_x: float,
+    scale_y: float,
+    offset_x: float,
+    offset_y: float,
+    baseline_ratio: float,
+    font_scale: float,
+    page_width: float,
+    page_height: float,
+    rot: int,
+) -> Tuple[float, float, float, float, float, float, float, float, float]:
+    """Scalar placement kernel behind :func:`geometry.map_bbox_to_pdf`.
+
+    Returns ``(anchor_x, anchor_y, x0, y0, x1, y1, font_size, width_pt, height_pt)``
+    with the anchor and rect already rotated into page space.
+    """
+    x_pt = image_x0 + (x_px * scale_x) + offset_x
+    y_bottom = image_y1 - ((y_px + h_px) * scale_y) + offset_y
+
+    width_pt = max(w_px * scale_x, 0.1)
+    height_pt = max(h_px * scale_y, 0.1)
+
+    font_size = max(height_pt * font_scale, 2.0)
+    baseline = y_bottom + font_size * baseline_ratio
+
+    x0 = x_pt
+    y0 = baseline - height_pt * (1 - baseline_ratio)
+    x1 = x_pt + width_pt
+    y1 = baseline + height_pt * baseline_ratio
+    if rot == 0:
+        # Unrotated pages (most scans) skip both rotation helpers.
+        return x_pt, baseline, x0, y0, x1, y1, font_size, width_pt, height_pt
+
+    anchor_x, anchor_y = rotate_point(x_pt, baseline, page_width, page_height, rot)
+    x0, y0, x1, y1 = rotate_box(x0, y0, x1, y1, page_width, page_height, rot)
+    return anchor_x, anchor_y, x0, y0, x1, y1, font_size, width_pt, height_pt
+
+
+@_jit(cache=True, nogil=True)
+def place_bboxes(
+    boxes: np.ndarray,
+    image_x0: float,
+    image_y1: float,
+    scale_x: float,
+    scale_y: float,
+    offset_x: float,
+    offset_y: float,
+    baseline_ratio: float,
+    font_scale: float,
+    page_width: float,
+    page_height: float,
+    rot: int,
+) -> np.ndarray:
+    """Run :func:`place_bbox` over an ``(N, 4)`` box array in one call.
+
+    Returns a ``(9, N)`` float64 array whose rows follow ``place_bbox``'s result order.
+    Only used when Numba is installed; the NumPy path in ``geometry`` covers the rest.
+    """
+    count = boxes.shape[0]
+    out = np.empty((9, count))
+    for row in range(count):
+        anchor_x, anchor_y, x0, y0, x1, y1, font_size, width_pt, height_pt = place_bbox(
+            boxes[row, 0],
+            boxes[row, 1],
+            boxes[row, 2],
+            boxes[row, 3],
+            image_x0,
+            image_y1,
+            scale_x,
+            scale_y,
+            offset_x,
+            offset_y,
+            baseline_ratio,
+            font_scale,
+            page_width,
+            page_height,
+            rot,
+        )
+        out[0, row] = anchor_x
+        out[1, row] = anchor_y
+        out[2, row] = x0
+        out[3, row] = y0
+        out[4, row] = x1
+        out[5, row] = y1
+        out[6, row] = font_size
+        out[7, row] = width_pt
+        out[8, row] = height_pt
+    return out
+
+
+@_jit(cache=True, nogil=True)
+def line_starts(ys: np.ndarray, tolerance: float) -> np.ndarray:
+    """Return the index where each line begins in Y-sorted, non-empty ``ys``.
+
+    A line is anchored at its first (top-most) word; later words join it while their Y stays
+    within ``tolerance`` of that anchor, so long runs of slightly drifting words do not chain.
+    """
+    starts = np.empty(ys.shape[0], dtype=np.intp)
+    starts[0] = 0
+    count = 1
+    anchor = ys[0]
+    for position in range(ys.shape[0]):
+        if abs(ys[position] - anchor) > tolerance:
+            starts[count] = position
+            count += 1
+            anchor = ys[position]
+    return starts[:count]
+
@@ -2,36 +2,38 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
+import re
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple
 
 import click
 
 from . import __version__
-from .overlay import OverlaySettings, apply_text_overlay
-from .ocr_io import (
-    OCRPage,
-    WinRTUnavailableError,
-    load_ocr_json,
-    run_winrt_ocr,
-    save_ocr_json,
-    winrt_available,
-)
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .ocr_io import OCRPage
+    from .overlay import OverlaySettings
+
+# The overlay/OCR modules pull in PyMuPDF, NumPy and the JIT kernels; they are imported
+# inside the command body so --help/--version and option validation stay lightweight.
 
 LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 
+_NUMBER = r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?"
+_PAIR_RE = re.compile(rf"\s*({_NUMBER})\s*,\s*({_NUMBER})\s*")
+
 
-def _parse_pair(value: str, ctx: click.Context, param: click.Parameter) -> Tuple[float, float]:
-    try:
-        x_str, y_str = value.split(",")
-        return float(x_str), float(y_str)
-    except Exception as exc:  # pragma: no cover - click handles errors
-        raise click.BadParameter("Expected two comma-separated numbers, e.g. 0.0,0.0") from exc
+def _parse_pair(ctx: click.Context, param: click.Parameter, value: str) -> Tuple[float, float]:
+    match = _PAIR_RE.fullmatch(value)
+    if match is None:
+        raise click.BadParameter("Expected two comma-separated numbers, e.g. 0.0,0.0")
+    return float(match.group(1)), float(match.group(2))
 
 
-def _parse_scale(value: str, ctx: click.Context, param: click.Parameter) -> Tuple[float, float]:
-    sx, sy = _parse_pair(value, ctx, param)
+def _parse_scale(ctx: click.Context, param: click.Parameter, value: str) -> Tuple[float, float]:
+    sx, sy = _parse_pair(ctx, param, value)
     if sx == 0 or sy == 0:
         raise click.BadParameter("Scale corrections must be non-zero.")
     return sx, sy
@@ -56,10 +58,18 @@ def _load_or_run_ocr(
     lang: str,
     max_pages: Optional[int],
     dump_ocr_json: Optional[Path],
-) -> list[OCRPage]:
+) -> Iterable[OCRPage]:
+    from .ocr_io import (
+        WinRTUnavailableError,
+        iter_ocr_json,
+        run_winrt_ocr,
+        save_ocr_json,
+        winrt_available,
+    )
+
     if ocr_json:
-        pages = load_ocr_json(ocr_json)
-        logging.info("Loaded OCR JSON with %d page entries.", len(pages))
+        pages: Iterable[OCRPage] = iter_ocr_json(ocr_json)
+        logging.info("Streaming OCR JSON from %s.", ocr_json)
     else:
         if not winrt_available():
             raise click.UsageError(
@@ -89,14 +99,27 @@ def _load_or_run_ocr(
     is_eager=True,
     help="Show the pdf_text_overlay version and exit.",
 )
-@click.option("--pdf", "pdf_path", type=click.Path(exists=True, dir_okay=False, path_type=Path), required=True, help="Input PDF file.")
+@click.option("--pdf", "pdf_path", type=click.Path(exists=True, dir_okay=False, path_type=Path), default=None, help="Input PDF file.")
+@click.option(
+    "--pdf-dir",
+    "pdf_dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="Process every *.pdf in this directory (sidecar <name>.json is used as OCR JSON when present); --out is then a directory.",
+)
 @click.option("--ocr-json", "ocr_json", type=click.Path(exists=True, dir_okay=False, path_type=Path), default=None, help="Precomputed OCR JSON path.")
-@click.option("--out", "out_path", type=click.Path(dir_okay=False, path_type=Path), required=True, help="Output searchable PDF path.")
+@click.option("--out", "out_path", type=click.Path(path_type=Path), required=True, help="Output searchable PDF path (directory with --pdf-dir).")
 @click.option("--dpi", default=300, show_default=True, type=click.IntRange(72, 1200), help="Render DPI when running WinRT OCR.")
 @click.option("--lang", default="ko-KR", show_default=True, help="OCR language tag for WinRT OCR.")
 @click.option("--granularity", default="word", type=click.Choice(["word", "line"]), show_default=True, help="Overlay granularity.")
 @click.option("--method", default="invisible", type=click.Choice(["invisible", "opacity"]), show_default=True, help="Rendering method for hidden text.")
 @click.option("--font", "font_path", type=click.Path(exists=True, dir_okay=False, path_type=Path), default=None, help="Font file to embed for overlay text.")
+@click.option(
+    "--embed-font/--no-embed-font",
+    "embed_font",
+    default=None,
+    help="Embed the overlay font. Default: only when text is drawn or a page needs non-Latin glyphs.",
+)
 @click.option("--baseline-ratio", default=0.15, show_default=True, type=click.FloatRange(0.0, 1.0), help="Baseline ratio within bounding box.")
 @click.option("--font-scale", default=1.0, show_default=True, type=click.FloatRange(0.1, 3.0), help="Scale factor applied to font size relative to bbox height.")
 @click.option("--align", default="auto", show_default=True, help="Alignment mode: auto, page, image:<xref>, or image-rect:x0,y0,x1,y1.")
@@ -110,13 +133,16 @@ def _load_or_run_ocr(
 @click.option("--dehyphen", is_flag=True, help="Recombine hyphenated line endings.")
 @click.option("--cjk-join", is_flag=True, help="Remove spaces between consecutive CJK characters.")
 @click.option("--pdfa", is_flag=True, help="Attempt to export as PDF/A-2b.")
+@click.option("--compact", "compact_output", is_flag=True, help="Fully garbage-collect and deflate on save (smaller output, slower save).")
 @click.option("--dump-ocr-json", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write OCR JSON to this path after WinRT OCR.")
 @click.option("--dump-debug-json", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write detailed placement diagnostics to JSON.")
 @click.option("--calibrate", default=0, show_default=True, type=click.IntRange(0, 1000), help="Log first N word placements for calibration.")
 @click.option("--max-pages", type=click.IntRange(1, 5000), default=None, help="Limit number of pages processed.")
+@click.option("--jobs", default=1, show_default=True, type=click.IntRange(0, 64), help="Worker processes for the overlay phase (parallel when > 1; 0 = one per CPU).")
 @click.option("--verbose", is_flag=True, help="Enable verbose logging.")
 def main(
-    pdf_path: Path,
+    pdf_path: Optional[Path],
+    pdf_dir: Optional[Path],
     ocr_json: Optional[Path],
     out_path: Path,
     dpi: int,
@@ -124,6 +150,7 @@ def main(
     granularity: str,
     method: str,
     font_path: Optional[Path],
+    embed_font: Optional[bool],
     baseline_ratio: float,
     font_scale: float,
     align: str,
@@ -137,28 +164,28 @@ def main(
     dehyphen: bool,
     cjk_join: bool,
     pdfa: bool,
+    compact_output: bool,
     dump_ocr_json: Optional[Path],
     dump_debug_json: Optional[Path],
     calibrate: int,
     max_pages: Optional[int],
+    jobs: int,
     verbose: bool,
 ) -> None:
     """Create a searchable PDF by overlaying OCR text."""
+    if (pdf_path is None) == (pdf_dir is None):
+        raise click.UsageError("Provide exactly one of --pdf or --pdf-dir.")
+    if pdf_dir is not None and (ocr_json or dump_ocr_json or dump_debug_json):
+        raise click.UsageError("--ocr-json, --dump-ocr-json and --dump-debug-json apply to a single --pdf only.")
+    # --out is a file for --pdf and a directory for --pdf-dir, so click.Path cannot check it.
+    if pdf_path is not None and out_path.is_dir():
+        raise click.BadParameter(f"{out_path} is a directory; --pdf writes a file.", param_hint="'--out'")
+    if pdf_dir is not None and out_path.exists() and not out_path.is_dir():
+        raise click.BadParameter(f"{out_path} is a file; --pdf-dir writes into a directory.", param_hint="'--out'")
 
-    _setup_logging(verbose)
-    logging.info("Starting pdf_text_overlay for %s", pdf_path)
+    from .overlay import OverlaySettings
 
-    pages = _load_or_run_ocr(
-        pdf_path=pdf_path,
-        ocr_json=ocr_json,
-        dpi=dpi,
-        lang=lang,
-        max_pages=max_pages,
-        dump_ocr_json=dump_ocr_json,
-    )
-
-    if not pages:
-        raise click.ClickException("No OCR data available to overlay.")
+    _setup_logging(verbose)
 
     if baseline_ratio <= 0.0 or baseline_ratio >= 1.0:
         logging.warning("Baseline ratio %.3f is extreme; consider staying within 0.1-0.3.", baseline_ratio)
@@ -176,7 +203,9 @@ def main(
         debug_overlay=debug_overlay,
         visible_qa=visible_qa,
         pdfa=pdfa,
+        compact_output=compact_output,
         font_path=font_path,
+        embed_font=embed_font,
         dpi=dpi,
         align=align,
         offset_pt=offset_pt,
@@ -185,7 +214,82 @@ def main(
         deskew=deskew,
         calibrate=calibrate,
         dump_debug_json=dump_debug_json,
+        jobs=jobs,
     )
 
-    apply_text_overlay(pdf_path=pdf_path, pages=pages, output_path=out_path, settings=settings)
+    if pdf_dir is not None:
+        _run_batch(pdf_dir, out_path, settings, dpi=dpi, lang=lang, max_pages=max_pages)
+        return
+
+    logging.info("Starting pdf_text_overlay for %s", pdf_path)
+    _overlay_one(pdf_path, ocr_json, out_path, settings, dpi, lang, max_pages, dump_ocr_json)
     logging.info("Completed overlay.")
+
+
+def _overlay_one(
+    pdf_path: Path,
+    ocr_json: Optional[Path],
+    out_path: Path,
+    settings: OverlaySettings,
+    dpi: int,
+    lang: str,
+    max_pages: Optional[int],
+    dump_ocr_json: Optional[Path] = None,
+) -> None:
+    from .overlay import apply_text_overlay
+
+    pages = _load_or_run_ocr(
+        pdf_path=pdf_path,
+        ocr_json=ocr_json,
+        dpi=dpi,
+        lang=lang,
+        max_pages=max_pages,
+        dump_ocr_json=dump_ocr_json,
+    )
+
+    pages_iter = iter(pages)
+    first_page = next(pages_iter, None)
+    if first_page is None:
+        raise click.ClickException(f"No OCR data available to overlay for {pdf_path}.")
+    pages = itertools.chain([first_page], pages_iter)
+
+    apply_text_overlay(pdf_path=pdf_path, pages=pages, output_path=out_path, settings=settings)
+
+
+def _run_batch(
+    pdf_dir: Path,
+    out_dir: Path,
+    settings: OverlaySettings,
+    dpi: int,
+    lang: str,
+    max_pages: Optional[int],
+) -> None:
+    """Overlay every PDF in *pdf_dir*, paying font resolution and OCR start-up once."""
+    from .fonts import packaged_font, resolve_font
+    from .ocr_io import WinRTUnavailableError, warm_up_winrt_ocr, winrt_available
+
+    pdf_paths = sorted(path for path in pdf_dir.iterdir() if path.is_file() and path.suffix.lower() == ".pdf")
+    if not pdf_paths:
+        raise click.ClickException(f"No PDF files found in {pdf_dir}.")
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    if settings.font_path is not None or packaged_font() is None:
+        try:
+            settings.font_path = resolve_font(settings.font_path)
+        except FileNotFoundError:
+            pass  # load_font logs the Helvetica fallback per document.
+
+    sidecars = {path: path.with_suffix(".json") for path in pdf_paths}
+    if any(not sidecar.is_file() for sidecar in sidecars.values()) and winrt_available():
+        try:
+            warm_up_winrt_ocr(lang)
+        except WinRTUnavailableError as exc:
+            raise click.UsageError(str(exc)) from exc
+
+    logging.info("Processing %d PDF(s) from %s", len(pdf_paths), pdf_dir)
+    for pdf_path in pdf_paths:
+        sidecar = sidecars[pdf_path]
+        out_path = out_dir / f"{pdf_path.stem}.searchable.pdf"
+        logging.info("Starting pdf_text_overlay for %s", pdf_path)
+        _overlay_one(pdf_path, sidecar if sidecar.is_file() else None, out_path, settings, dpi, lang, max_pages)
+    logging.info("Completed overlay of %d PDF(s).", len(pdf_paths))
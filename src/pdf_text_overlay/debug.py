@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Iterable, Tuple
+from typing import Iterable, Optional, Tuple
 
 try:
     import fitz  # type: ignore
@@ -12,38 +12,53 @@ except ImportError:  # pragma: no cover - optional dependency
 
 logger = logging.getLogger(__name__)
 
+Color = Tuple[float, float, float]
+
 
 def draw_debug_overlay(
     page: fitz.Page,
     rect: "fitz.Rect",
-    color: Tuple[float, float, float] = (0, 1, 0),
+    color: Color = (0, 1, 0),
 ) -> None:
     """Draw a translucent rectangle representing OCR bounding box."""
+    draw_debug_overlays(page, [rect], [color])
+
+
+def draw_debug_overlays(
+    page: fitz.Page,
+    rects: Iterable["fitz.Rect"],
+    colors: Optional[Iterable[Color]] = None,
+) -> None:
+    """Draw translucent OCR bounding boxes with a single shape commit per call.
+
+    ``colors`` is paired with ``rects`` in order; every box is green when omitted.
+    """
     if fitz is None:  # pragma: no cover - defensive check
         raise RuntimeError("PyMuPDF is required for debug overlay drawing.")
-    corners = [
-        fitz.Point(rect.x0, rect.y0),
-        fitz.Point(rect.x1, rect.y0),
-        fitz.Point(rect.x1, rect.y1),
-        fitz.Point(rect.x0, rect.y1),
-    ]
     shape = page.new_shape()
-    shape.draw_polyline(corners + [corners[0]])
-    shape.finish(color=color, fill=(color[0], color[1], color[2], 0.1))
+    if colors is None:
+        for rect in rects:
+            shape.draw_rect(rect)
+        shape.finish(color=(0, 1, 0), fill=(0, 1, 0, 0.1))
+    else:
+        for rect, color in zip(rects, colors):
+            shape.draw_rect(rect)
+            shape.finish(color=color, fill=(color[0], color[1], color[2], 0.1))
     shape.commit()
 
 
 def draw_visible_text(page: fitz.Page, rect: "fitz.Rect", rotation: float) -> None:
     """Overlay a faint gray rectangle to indicate QA text placement."""
+    draw_visible_texts(page, [rect])
+
+
+def draw_visible_texts(page: fitz.Page, rects: Iterable["fitz.Rect"]) -> None:
+    """Overlay faint gray QA rectangles with a single shape commit per call."""
     if fitz is None:  # pragma: no cover
         raise RuntimeError("PyMuPDF is required for debug overlay drawing.")
     shape = page.new_shape()
-    corners = [
-        fitz.Point(rect.x0, rect.y0),
-        fitz.Point(rect.x1, rect.y0),
-        fitz.Point(rect.x1, rect.y1),
-        fitz.Point(rect.x0, rect.y1),
-    ]
-    shape.draw_polyline(corners + [corners[0]])
+    for rect in rects:
+        shape.draw_rect(rect)
     shape.finish(color=(0.6, 0.6, 0.6), fill=(0.6, 0.6, 0.6, 0.05))
     shape.commit()
+
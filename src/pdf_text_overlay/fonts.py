@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
+import warnings
 from importlib import resources
 from pathlib import Path
-from typing import Iterable, Optional, TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING, Tuple
 
 try:
     import fitz  # type: ignore
@@ -18,50 +20,74 @@ logger = logging.getLogger(__name__)
 if TYPE_CHECKING:  # pragma: no cover - typing only
     import fitz  # type: ignore
 
-_WINDOWS_FONT_DIRS = [
-    Path(os.environ.get("WINDIR", r"C:\Windows")) / "Fonts",
-    Path(os.environ.get("LOCALAPPDATA", r"C:\Users\Public")) / "Microsoft\Windows\Fonts",
-]
+_FONT_SUFFIXES = (".ttf", ".otf", ".ttc")
+
+# Existing font directories, probed once at import instead of on every lookup.
+_WINDOWS_FONT_DIRS: Tuple[Path, ...] = tuple(
+    directory
+    for directory in (
+        Path(os.environ.get("WINDIR", r"C:\Windows")) / "Fonts",
+        Path(os.environ.get("LOCALAPPDATA", r"C:\Users\Public")) / "Microsoft" / "Windows" / "Fonts",
+    )
+    if directory.is_dir()
+)
 
 
-def _iter_packaged_fonts() -> Iterable[Path]:
+@functools.lru_cache(maxsize=1)
+def packaged_font() -> Optional[Tuple[str, bytes]]:
+    """Return ``(name, data)`` of the first packaged font, or ``None`` if none is shipped.
+
+    The bytes are read from the resource itself: a path from ``resources.as_file`` may be a
+    temporary extraction that no longer exists once its context exits. Only the selected
+    font is read.
+    """
     try:
         font_root = resources.files("pdf_text_overlay.resources") / "fonts"
     except (ModuleNotFoundError, AttributeError):
-        return
+        return None
     for entry in font_root.iterdir():
-        if entry.name.lower().endswith((".ttf", ".otf", ".ttc")):
-            with resources.as_file(entry) as path:
-                yield path
+        if entry.name.lower().endswith(_FONT_SUFFIXES):
+            logger.debug("Found packaged font: %s", entry.name)
+            return entry.name, entry.read_bytes()
+    return None
 
 
-def _iter_system_fonts() -> Iterable[Path]:
+@functools.lru_cache(maxsize=1)
+def _iter_system_fonts() -> Tuple[Path, ...]:
+    found = []
     for directory in _WINDOWS_FONT_DIRS:
-        if not directory.exists():
+        # scandir returns cached name/type info from a single directory read.
+        try:
+            entries = os.scandir(directory)
+        except OSError:
             continue
-        for candidate in directory.glob("*.tt*"):
-            yield candidate
+        with entries:
+            for entry in entries:
+                if entry.name.lower().endswith(_FONT_SUFFIXES) and entry.is_file(follow_symlinks=False):
+                    found.append(Path(entry.path))
     linux_candidates = [
         Path("/usr/share/fonts/truetype/noto/NotoSansCJK-Regular.ttc"),
         Path("/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.otf"),
     ]
-    for candidate in linux_candidates:
-        if candidate.exists():
-            yield candidate
+    found.extend(candidate for candidate in linux_candidates if candidate.exists())
+    return tuple(found)
 
 
+@functools.cache
 def resolve_font(font_path: Optional[Path]) -> Path:
-    """Resolve font path from CLI or fallbacks."""
+    """Resolve font path from CLI or system fallbacks.
+
+    Packaged fonts have no stable path and are not returned here; :func:`load_font` prefers
+    :func:`packaged_font` when no ``font_path`` is given. Results are memoised per
+    ``font_path`` for the life of the process; tests that change the font environment
+    should call ``resolve_font.cache_clear()``.
+    """
     if font_path:
         candidate = font_path.expanduser()
         if not candidate.is_file():
             raise FileNotFoundError(f"Font file not found: {candidate}")
         return candidate
 
-    for candidate in _iter_packaged_fonts():
-        logger.debug("Found packaged font: %s", candidate)
-        return candidate
-
     for candidate in _iter_system_fonts():
         logger.debug("Found system font: %s", candidate)
         return candidate
@@ -71,20 +97,46 @@ def resolve_font(font_path: Optional[Path]) -> Path:
     )
 
 
-def register_font(doc: fitz.Document, font_path: Optional[Path]) -> str:
-    """Register font with fitz document and return its internal name."""
+def load_font(font_path: Optional[Path]) -> fitz.Font:
+    """Load the overlay font, falling back to built-in Helvetica.
+
+    PDF embedding happens when text using the font is written to a page (once per document).
+    The overlay skips this call for invisible text it can encode with built-in Helvetica
+    (see ``OverlaySettings.embed_font``); only pages that need other glyphs embed a font.
+    """
     if fitz is None:
-        raise RuntimeError("PyMuPDF (fitz) is required to register fonts.")
-    try:
-        resolved = resolve_font(font_path)
-    except FileNotFoundError as exc:
-        logger.warning("%s Falling back to built-in Helvetica font.", exc)
-        return "helv"
+        raise RuntimeError("PyMuPDF (fitz) is required to load fonts.")
+    packaged = None if font_path else packaged_font()
+    if packaged is not None:
+        label, data = packaged
+        loader = functools.partial(fitz.Font, fontbuffer=data)
+    else:
+        try:
+            label = resolve_font(font_path)
+        except FileNotFoundError as exc:
+            logger.warning("%s Falling back to built-in Helvetica font.", exc)
+            return fitz.Font("helv")
+        loader = functools.partial(fitz.Font, fontfile=str(label))
 
     try:
-        font_name = doc.insert_font(fontfile=str(resolved))
-        logger.debug("Registered font %s as %s", resolved, font_name)
-        return font_name
+        font = loader()
+        logger.debug("Loaded font %s (%s)", label, font.name)
+        return font
     except Exception as exc:  # pragma: no cover - dependent on font availability
-        logger.warning("Failed to load font %s (%s). Falling back to Helvetica.", resolved, exc)
+        logger.warning("Failed to load font %s (%s). Falling back to Helvetica.", label, exc)
+        return fitz.Font("helv")
+
+
+def register_font(doc: fitz.Document, font_path: Optional[Path]) -> str:
+    """Register the overlay font on every page of *doc* and return its ``fontname``.
+
+    Deprecated: the overlay now loads fonts with :func:`load_font` and embeds them only on
+    pages that need them. Returns ``"helv"`` when falling back to built-in Helvetica.
+    """
+    warnings.warn("register_font is deprecated; use load_font instead.", DeprecationWarning, stacklevel=2)
+    font = load_font(font_path)
+    if font.name.startswith("Helvetica"):
         return "helv"
+    for page in doc:
+        page.insert_font(fontname="OCRText", fontbuffer=font.buffer)
+    return "OCRText"
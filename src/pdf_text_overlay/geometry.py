@@ -3,10 +3,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Callable, Dict, Tuple
 
+import numpy as np
 
-@dataclass
+from . import _kernels
+
+
+# Row order of ``_kernels.place_bboxes`` output.
+_PLACEMENT_KEYS = ("anchor_x", "anchor_y", "x0", "y0", "x1", "y1", "font_size", "width_pt", "height_pt")
+
+
+@dataclass(slots=True, frozen=True)
 class Rect:
     x0: float
     y0: float
@@ -22,7 +30,7 @@ class Rect:
         return self.y1 - self.y0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MappingConfig:
     image_rect: Rect
     page_rect: Rect
@@ -34,7 +42,7 @@ class MappingConfig:
     deskew: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Placement:
     anchor: Tuple[float, float]
     rect: Rect
@@ -52,43 +60,119 @@ def map_bbox_to_pdf(
 ) -> Placement:
     """Map a pixel-space bounding box to PDF space using the provided configuration."""
     x_px, y_px, w_px, h_px = bbox
-    if config.width_px <= 0 or config.height_px <= 0:
-        raise ValueError("Mapping configuration requires positive width/height in pixels.")
+    scale_x, scale_y = _scale_factors(config)
+    offset_x, offset_y = config.offset_pt
+
+    anchor_x, anchor_y, x0, y0, x1, y1, font_size, width_pt, height_pt = _kernels.place_bbox(
+        float(x_px),
+        float(y_px),
+        float(w_px),
+        float(h_px),
+        float(config.image_rect.x0),
+        float(config.image_rect.y1),
+        scale_x,
+        scale_y,
+        float(offset_x),
+        float(offset_y),
+        float(baseline_ratio),
+        float(font_scale),
+        float(config.page_rect.width),
+        float(config.page_rect.height),
+        _normalize_rotation(config.rotation),
+    )
+
+    return Placement(
+        anchor=(anchor_x, anchor_y),
+        rect=Rect(x0=x0, y0=y0, x1=x1, y1=y1),
+        font_size=font_size,
+        rotate=config.rotation + config.deskew,
+        width_pt=width_pt,
+        height_pt=height_pt,
+    )
 
-    scale_x = (config.image_rect.width / config.width_px) * config.scale_corr[0]
-    scale_y = (config.image_rect.height / config.height_px) * config.scale_corr[1]
-    if scale_x == 0 or scale_y == 0:
-        raise ValueError("Scaling factors must be non-zero.")
 
+def map_bboxes_to_pdf(
+    bboxes: np.ndarray,
+    baseline_ratio: float,
+    font_scale: float,
+    config: MappingConfig,
+) -> Dict[str, np.ndarray]:
+    """Vectorised :func:`map_bbox_to_pdf` over an ``(N, 4)`` array of pixel bboxes.
+
+    Returns a structure of arrays keyed by ``x0``, ``y0``, ``x1``, ``y1`` (rotated rect),
+    ``anchor_x``, ``anchor_y``, ``font_size``, ``width_pt`` and ``height_pt``.
+    """
+    boxes = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4)
+    scale_x, scale_y = _scale_factors(config)
     offset_x, offset_y = config.offset_pt
+    rot = _normalize_rotation(config.rotation)
+    page_width, page_height = float(config.page_rect.width), float(config.page_rect.height)
+    if _kernels.NUMBA_AVAILABLE:
+        columns = _kernels.place_bboxes(
+            boxes,
+            float(config.image_rect.x0),
+            float(config.image_rect.y1),
+            scale_x,
+            scale_y,
+            float(offset_x),
+            float(offset_y),
+            float(baseline_ratio),
+            float(font_scale),
+            page_width,
+            page_height,
+            rot,
+        )
+        return dict(zip(_PLACEMENT_KEYS, columns))
 
+    x_px, y_px, w_px, h_px = boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
     x_pt = config.image_rect.x0 + (x_px * scale_x) + offset_x
     y_bottom = config.image_rect.y1 - ((y_px + h_px) * scale_y) + offset_y
 
-    width_pt = max(w_px * scale_x, 0.1)
-    height_pt = max(h_px * scale_y, 0.1)
+    width_pt = np.maximum(w_px * scale_x, 0.1)
+    height_pt = np.maximum(h_px * scale_y, 0.1)
 
-    font_size = max(height_pt * font_scale, 2.0)
+    font_size = np.maximum(height_pt * font_scale, 2.0)
     baseline = y_bottom + font_size * baseline_ratio
 
-    rect = Rect(
-        x0=x_pt,
-        y0=baseline - height_pt * (1 - baseline_ratio),
-        x1=x_pt + width_pt,
-        y1=baseline + height_pt * baseline_ratio,
+    anchor_x, anchor_y = _kernels.rotate_points(x_pt, baseline, page_width, page_height, rot)
+    x0, y0, x1, y1 = _kernels.rotate_boxes(
+        x_pt,
+        baseline - height_pt * (1 - baseline_ratio),
+        x_pt + width_pt,
+        baseline + height_pt * baseline_ratio,
+        page_width,
+        page_height,
+        rot,
     )
+    return {
+        "x0": x0,
+        "y0": y0,
+        "x1": x1,
+        "y1": y1,
+        "anchor_x": anchor_x,
+        "anchor_y": anchor_y,
+        "font_size": font_size,
+        "width_pt": width_pt,
+        "height_pt": height_pt,
+    }
+
+
+def _scale_factors(config: MappingConfig) -> Tuple[float, float]:
+    if config.width_px <= 0 or config.height_px <= 0:
+        raise ValueError("Mapping configuration requires positive width/height in pixels.")
 
-    anchor = apply_rotation((x_pt, baseline), config.page_rect, config.rotation)
-    rotated_rect = rotate_rect(rect, config.page_rect, config.rotation)
+    scale_x = (config.image_rect.width / config.width_px) * config.scale_corr[0]
+    scale_y = (config.image_rect.height / config.height_px) * config.scale_corr[1]
+    if scale_x == 0 or scale_y == 0:
+        raise ValueError("Scaling factors must be non-zero.")
+    return float(scale_x), float(scale_y)
 
-    return Placement(
-        anchor=anchor,
-        rect=rotated_rect,
-        font_size=font_size,
-        rotate=config.rotation + config.deskew,
-        width_pt=width_pt,
-        height_pt=height_pt,
-    )
+
+def _normalize_rotation(rotation: float) -> int:
+    # int() would silently truncate e.g. 90.5 to a valid-looking 90.
+    if rotation != int(rotation):
+        raise ValueError(f"Rotation must be a whole number of degrees, got {rotation!r}.")
+    return int(rotation) % 360
 
 
 def apply_rotation(
@@ -98,42 +182,54 @@ def apply_rotation(
 ) -> Tuple[float, float]:
     """Rotate a point according to the page rotation (multiples of 90)."""
     x, y = point
-    rot = rotation % 360
-    if rot == 0:
-        return (x, y)
-    if rot == 90:
-        return (page_rect.width - y, x)
-    if rot == 180:
-        return (page_rect.width - x, page_rect.height - y)
-    if rot == 270:
-        return (y, page_rect.height - x)
-    raise ValueError("Rotation must be 0/90/180/270 degrees.")
+    return _kernels.rotate_point(
+        float(x),
+        float(y),
+        float(page_rect.width),
+        float(page_rect.height),
+        _normalize_rotation(rotation),
+    )
 
 
 def rotate_rect(rect: Rect, page_rect: Rect, rotation: int) -> Rect:
     """Rotate a rectangle axis-aligned with rotation multiples of 90 degrees."""
-    rot = rotation % 360
+    rot = _normalize_rotation(rotation)
     if rot == 0:
         return rect
-    if rot == 180:
-        return Rect(
-            x0=page_rect.width - rect.x1,
-            y0=page_rect.height - rect.y1,
-            x1=page_rect.width - rect.x0,
-            y1=page_rect.height - rect.y0,
-        )
-    if rot == 90:
-        return Rect(
-            x0=page_rect.width - rect.y1,
-            y0=rect.x0,
-            x1=page_rect.width - rect.y0,
-            y1=rect.x1,
-        )
-    if rot == 270:
-        return Rect(
-            x0=rect.y0,
-            y0=page_rect.height - rect.x1,
-            x1=rect.y1,
-            y1=page_rect.height - rect.x0,
-        )
-    raise ValueError("Rotation must be 0/90/180/270 degrees.")
+    x0, y0, x1, y1 = _kernels.rotate_box(
+        float(rect.x0),
+        float(rect.y0),
+        float(rect.x1),
+        float(rect.y1),
+        float(page_rect.width),
+        float(page_rect.height),
+        rot,
+    )
+    return Rect(x0=x0, y0=y0, x1=x1, y1=y1)
+
+
+def make_point_rotator(
+    rotation: int,
+    page_rect: Rect,
+) -> Callable[[Tuple[float, float]], Tuple[float, float]]:
+    """Return a point rotator for *rotation*, validating the rotation up front.
+
+    The returned callable also accepts NumPy arrays for the coordinates.
+    """
+    rot = _checked_rotation(rotation)
+    width, height = float(page_rect.width), float(page_rect.height)
+    return lambda point: _kernels.rotate_points(point[0], point[1], width, height, rot)
+
+
+def make_rotator(rotation: int, page_rect: Rect) -> Callable[[Rect], Rect]:
+    """Return a rect rotator for *rotation*, validating the rotation up front."""
+    rot = _checked_rotation(rotation)
+    width, height = float(page_rect.width), float(page_rect.height)
+    return lambda rect: Rect(*_kernels.rotate_boxes(rect.x0, rect.y0, rect.x1, rect.y1, width, height, rot))
+
+
+def _checked_rotation(rotation: int) -> int:
+    rot = _normalize_rotation(rotation)
+    if rot % 90:
+        raise ValueError("Rotation must be 0/90/180/270 degrees.")
+    return rot
@@ -0,0 +1,20 @@
+"""Helpers for writing an ``indent=2`` JSON array one element at a time."""
+
+from __future__ import annotations
+
+
+def array_item(item_json: str, depth: int, first: bool) -> str:
+    """Return the text that appends ``indent=2`` JSON *item_json* to an open array.
+
+    *depth* is the array's nesting level (1 for a top-level array). Writing ``"["``, then this
+    for each element, then :func:`array_end` gives the same text as dumping the whole array
+    with ``indent=2``.
+    """
+    pad = "\n" + "  " * depth
+    # JSON escapes newlines inside strings, so every newline here is layout.
+    return ("" if first else ",") + pad + item_json.replace("\n", pad)
+
+
+def array_end(count: int, depth: int) -> str:
+    """Return the text that closes an array of *count* elements opened at *depth*."""
+    return "\n" + "  " * (depth - 1) + "]" if count else "]"
@@ -3,16 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
+import operator
 import os
 import platform
 import struct
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from . import _kernels
 
 try:
     import fitz  # type: ignore
@@ -24,23 +30,36 @@ try:
 except ImportError:  # pragma: no cover - optional dependency
     Image = None  # type: ignore
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+try:
+    import ijson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
+# OCR JSON larger than this is parsed incrementally so the raw dict tree never exists whole.
+STREAM_THRESHOLD_BYTES = 10 * 1024 * 1024
 
-@dataclass
+
+@dataclass(slots=True)
 class OCRWord:
     text: str
     bbox: Tuple[float, float, float, float]
 
 
-@dataclass
+@dataclass(slots=True)
 class OCRLine:
     text: str
     bbox: Tuple[float, float, float, float]
     words: List[OCRWord] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class OCRPage:
     index: int
     width_px: float
@@ -49,6 +68,27 @@ class OCRPage:
     words: List[OCRWord] = field(default_factory=list)
     lines: List[OCRLine] = field(default_factory=list)
 
+    # Structure-of-arrays views of ``words``. They are built on access, so they always match
+    # the current words; read each column once per page rather than per word.
+    @property
+    def word_bboxes(self) -> np.ndarray:
+        """``(N, 4)`` float64 x/y/w/h boxes of ``words``."""
+        return _word_boxes(self.words)
+
+    @property
+    def word_texts(self) -> List[str]:
+        """Texts of ``words``, in the same order as :attr:`word_bboxes`."""
+        return [word.text for word in self.words]
+
+
+def _word_boxes(words: Sequence[OCRWord]) -> np.ndarray:
+    """Pack word bboxes into an ``(N, 4)`` float64 x/y/w/h array."""
+    return np.fromiter(
+        (value for word in words for value in word.bbox),
+        dtype=np.float64,
+        count=4 * len(words),
+    ).reshape(-1, 4)
+
 
 class WinRTUnavailableError(RuntimeError):
     """Raised when WinRT OCR cannot be used."""
@@ -63,15 +103,30 @@ class _RectProtocol:
     height: float
 
 
+_RECT_ATTRS = ("bounding_rect", "boundingRect", "BoundingRect", "rect")
+
+
 def _extract_rect(entity: Any) -> Optional[_RectProtocol]:
     """Try to extract a rectangle-like object from WinRT OCR entities."""
-    for attr in ("bounding_rect", "boundingRect", "BoundingRect", "rect"):
+    for attr in _RECT_ATTRS:
         rect = getattr(entity, attr, None)
         if rect is not None:
             return rect
     return None
 
 
+def _rect_reader(entity: Any) -> Callable[[Any], Optional[_RectProtocol]]:
+    """Return a rect accessor bound to the attribute name *entity*'s WinRT binding uses.
+
+    All OCR words (or lines) from one binding share a type, so probing the first one lets the
+    hot loop use a single attrgetter instead of walking every candidate name.
+    """
+    for attr in _RECT_ATTRS:
+        if getattr(entity, attr, None) is not None:
+            return operator.attrgetter(attr)
+    return _extract_rect
+
+
 def _decode_bbox(value: Sequence[float]) -> Tuple[float, float, float, float]:
     if len(value) != 4:
         raise ValueError("Bounding box must contain 4 numeric entries.")
@@ -81,55 +136,90 @@ def _decode_bbox(value: Sequence[float]) -> Tuple[float, float, float, float]:
 
 def load_ocr_json(path: Path) -> List[OCRPage]:
     """Load OCR JSON file into structured objects."""
+    return list(iter_ocr_json(path))
+
+
+def iter_ocr_json(path: Path) -> Iterator[OCRPage]:
+    """Yield OCR pages one at a time.
+
+    Files above ``STREAM_THRESHOLD_BYTES`` are streamed with ijson when installed. Streaming
+    is slower per byte than a full parse; it only bounds peak memory to one page's dict tree.
+    """
     if not path.is_file():
         raise FileNotFoundError(f"OCR JSON not found: {path}")
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    if not isinstance(payload, list):
+    if ijson is None or path.stat().st_size <= STREAM_THRESHOLD_BYTES:
+        raw = path.read_bytes()
+        payload = _loads(raw)
+        if not isinstance(payload, list):
+            raise ValueError("OCR JSON must be a list of page objects.")
+        return _pages_from_entries(payload)
+
+    with path.open("rb") as handle:
+        head = handle.read(64).lstrip(b"\xef\xbb\xbf \t\r\n")
+    if not head.startswith(b"["):
         raise ValueError("OCR JSON must be a list of page objects.")
+    return _stream_pages(path)
 
-    pages: List[OCRPage] = []
-    for entry in payload:
-        index = int(entry.get("page", len(pages)))
-        width_px = float(entry.get("width_px") or entry.get("width"))
-        height_px = float(entry.get("height_px") or entry.get("height"))
-        rotation = entry.get("rotation")
-        words_raw = entry.get("words", [])
-        lines_raw = entry.get("lines", [])
-        words = [
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # json also accepts the NaN/Infinity literals save_ocr_json may write.
+            pass
+    return json.loads(raw.decode("utf-8"))
+
+
+def _stream_pages(path: Path) -> Iterator[OCRPage]:
+    with path.open("rb") as handle:
+        yield from _pages_from_entries(ijson.items(handle, "item", use_float=True))
+
+
+def _pages_from_entries(entries: Iterable[Dict[str, Any]]) -> Iterator[OCRPage]:
+    for position, entry in enumerate(entries):
+        yield _page_from_entry(entry, position)
+
+
+def _page_from_entry(entry: Dict[str, Any], position: int) -> OCRPage:
+    index = int(entry.get("page", position))
+    width_px = float(entry.get("width_px") or entry.get("width"))
+    height_px = float(entry.get("height_px") or entry.get("height"))
+    rotation = entry.get("rotation")
+    words_raw = entry.get("words", [])
+    lines_raw = entry.get("lines", [])
+    words = [
+        OCRWord(text=str(word["text"]), bbox=_decode_bbox(word["bbox"]))
+        for word in words_raw
+        if "text" in word and "bbox" in word
+    ]
+    lines = []
+    for line in lines_raw:
+        if "text" not in line or "bbox" not in line:
+            continue
+        line_words = [
             OCRWord(text=str(word["text"]), bbox=_decode_bbox(word["bbox"]))
-            for word in words_raw
+            for word in line.get("words", [])
             if "text" in word and "bbox" in word
         ]
-        lines = []
-        for line in lines_raw:
-            if "text" not in line or "bbox" not in line:
-                continue
-            line_words = [
-                OCRWord(text=str(word["text"]), bbox=_decode_bbox(word["bbox"]))
-                for word in line.get("words", [])
-                if "text" in word and "bbox" in word
-            ]
-            lines.append(
-                OCRLine(
-                    text=str(line["text"]),
-                    bbox=_decode_bbox(line["bbox"]),
-                    words=line_words,
-                )
-            )
-
-        if not lines and words:
-            lines = _lines_from_words(words)
-        pages.append(
-            OCRPage(
-                index=index,
-                width_px=width_px,
-                height_px=height_px,
-                rotation=int(rotation) if rotation is not None else None,
-                words=words,
-                lines=lines,
+        lines.append(
+            OCRLine(
+                text=str(line["text"]),
+                bbox=_decode_bbox(line["bbox"]),
+                words=line_words,
             )
         )
-    return pages
+
+    if not lines and words:
+        lines = _lines_from_words(words)
+    return OCRPage(
+        index=index,
+        width_px=width_px,
+        height_px=height_px,
+        rotation=int(rotation) if rotation is not None else None,
+        words=words,
+        lines=lines,
+    )
 
 
 def save_ocr_json(pages: Sequence[OCRPage], path: Path) -> None:
@@ -160,34 +250,59 @@ def save_ocr_json(pages: Sequence[OCRPage], path: Path) -> None:
             }
         )
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    encoded = None
+    # orjson writes NaN/Infinity as null, which would not load back; json keeps them.
+    if orjson is not None and all(map(_finite_page, pages)):
+        try:
+            encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            encoded = None
+    if encoded is not None:
+        path.write_bytes(encoded)
+    else:
+        path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
     logger.info("Dumped OCR JSON to %s", path)
 
 
-def _lines_from_words(words: Sequence[OCRWord], tolerance: float = 4.0) -> List[OCRLine]:
-    """Group words into lines based on Y proximity."""
-    sorted_words = sorted(words, key=lambda w: (w.bbox[1], w.bbox[0]))
+def _finite_page(page: OCRPage) -> bool:
+    values = [page.width_px, page.height_px]
+    values.extend(value for line in page.lines for value in line.bbox)
+    values.extend(value for line in page.lines for word in line.words for value in word.bbox)
+    return bool(np.isfinite(page.word_bboxes).all() and np.isfinite(np.asarray(values, dtype=np.float64)).all())
+
+
+def _lines_from_words(
+    words: Sequence[OCRWord],
+    tolerance: float = 4.0,
+    boxes: Optional[np.ndarray] = None,
+) -> List[OCRLine]:
+    """Group words into lines based on Y proximity.
+
+    ``boxes`` may pass the words' already packed ``(N, 4)`` float64 array.
+    """
+    if not words:
+        return []
+    if boxes is None:
+        boxes = _word_boxes(words)
+    order = np.lexsort((boxes[:, 0], boxes[:, 1]))
+    boxes = boxes[order]
+    starts = _kernels.line_starts(np.ascontiguousarray(boxes[:, 1]), float(tolerance))
+
+    x0 = np.minimum.reduceat(boxes[:, 0], starts)
+    y0 = np.minimum.reduceat(boxes[:, 1], starts)
+    x1 = np.maximum.reduceat(boxes[:, 0] + boxes[:, 2], starts)
+    y1 = np.maximum.reduceat(boxes[:, 1] + boxes[:, 3], starts)
+    line_boxes = zip(x0.tolist(), y0.tolist(), (x1 - x0).tolist(), (y1 - y0).tolist())
+
+    sorted_words = [words[i] for i in order.tolist()]
+    bounds = starts.tolist() + [len(sorted_words)]
     lines: List[OCRLine] = []
-    current: Optional[OCRLine] = None
-    for word in sorted_words:
-        if current is None:
-            current = OCRLine(text=word.text, bbox=word.bbox, words=[word])
-            continue
-        _, current_y, _, current_h = current.bbox
-        x, y, w, h = word.bbox
-        if abs(y - current_y) <= tolerance:
-            current.text += " " + word.text
-            current.words.append(word)
-            x0 = min(current.bbox[0], x)
-            y0 = min(current.bbox[1], y)
-            x1 = max(current.bbox[0] + current.bbox[2], x + w)
-            y1 = max(current.bbox[1] + current.bbox[3], y + h)
-            current.bbox = (x0, y0, x1 - x0, y1 - y0)
-        else:
-            lines.append(current)
-            current = OCRLine(text=word.text, bbox=word.bbox, words=[word])
-    if current:
-        lines.append(current)
+    for start, stop, bbox in zip(bounds, bounds[1:], line_boxes):
+        line_words = sorted_words[start:stop]
+        if len(line_words) == 1:
+            # (x + w) - x need not equal w exactly; a lone word keeps its own box.
+            bbox = line_words[0].bbox
+        lines.append(OCRLine(text=" ".join(word.text for word in line_words), bbox=bbox, words=line_words))
     return lines
 
 
@@ -213,24 +328,23 @@ def sys_version_tuple() -> Tuple[int, int]:
 
 
 async def _pil_to_software_bitmap(image: Image.Image) -> Any:
-    from winrt.windows.storage.streams import InMemoryRandomAccessStream, DataWriter  # type: ignore
-    from winrt.windows.graphics.imaging import BitmapDecoder  # type: ignore
-
-    buffer = BytesIO()
-    image.save(buffer, format="PNG")
-    data = buffer.getvalue()
-
-    stream = InMemoryRandomAccessStream()
-    writer = DataWriter(stream)
-    writer.write_bytes(data)
-    await writer.store_async()
-    await writer.flush_async()
-    writer.detach_stream()
-    writer.close()
-    stream.seek(0)
-
-    decoder = await BitmapDecoder.create_async(stream)
-    return await decoder.get_software_bitmap_async()
+    """Copy the image's pixels straight into a BGRA8 SoftwareBitmap (no PNG round trip)."""
+    from winrt.windows.storage.streams import DataWriter  # type: ignore
+    from winrt.windows.graphics.imaging import BitmapAlphaMode, BitmapPixelFormat, SoftwareBitmap  # type: ignore
+
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    writer = DataWriter()
+    # "BGRX" packs RGB into BGRA8 layout in one pass; the pad byte is ignored as alpha.
+    writer.write_bytes(image.tobytes("raw", "BGRX"))
+    buffer = writer.detach_buffer()
+    return SoftwareBitmap.create_copy_from_buffer(
+        buffer,
+        BitmapPixelFormat.BGRA8,
+        image.width,
+        image.height,
+        BitmapAlphaMode.IGNORE,
+    )
 
 
 async def _recognize_bitmap(engine: Any, bitmap: Any) -> Any:
@@ -244,6 +358,39 @@ async def _recognize_bitmap(engine: Any, bitmap: Any) -> Any:
         return await engine.recognize_async(converted)
 
 
+async def _ocr_image(engine: Any, image: Image.Image) -> Any:
+    bitmap = await _pil_to_software_bitmap(image)
+    return await _recognize_bitmap(engine, bitmap)
+
+
+@functools.cache
+def _ocr_engine(language: str) -> Any:
+    """Create the WinRT OCR engine for *language*, once per process."""
+    from winrt.windows.media.ocr import OcrEngine  # type: ignore
+    from winrt.windows.globalization import Language  # type: ignore
+
+    engine = None
+    try:
+        engine = OcrEngine.try_create_from_language(Language(language))
+    except Exception:
+        engine = None
+    if engine is None:
+        engine = OcrEngine.try_create_from_user_profile_languages()
+    if engine is None:
+        raise WinRTUnavailableError(
+            "Windows OCR language not available. Install the language pack via Windows Settings."
+        )
+    return engine
+
+
+def warm_up_winrt_ocr(language: str) -> None:
+    """Create the OCR engine and run one tiny recognition so the first real page skips init cost."""
+    if Image is None or not winrt_available():
+        raise WinRTUnavailableError("WinRT OCR is unavailable on this system.")
+    engine = _ocr_engine(language)
+    asyncio.run(_ocr_image(engine, Image.new("RGB", (64, 64), "white")))
+
+
 def run_winrt_ocr(
     pdf_path: Path,
     dpi: int,
@@ -260,42 +407,36 @@ def run_winrt_ocr(
             "WinRT OCR is unavailable. Use --ocr-json or install 64-bit Python 3.11 on Windows with winrt packages."
         )
 
-    from winrt.windows.media.ocr import OcrEngine  # type: ignore
-    from winrt.windows.globalization import Language  # type: ignore
-
     doc = fitz.open(pdf_path)
-    scale = dpi / 72.0
+    matrix = fitz.Matrix(dpi / 72.0, dpi / 72.0)
     pages: List[OCRPage] = []
 
+    # MuPDF is not safe to drive from several threads, so a single render thread owns the
+    # document and prefetches page N+1 while the main thread runs OCR on page N.
+    renderer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ocr-render")
+    loop = asyncio.new_event_loop()
     try:
-        engine = None
-        try:
-            engine = OcrEngine.try_create_from_language(Language(language))
-        except Exception:
-            engine = None
-        if engine is None:
-            engine = OcrEngine.try_create_from_user_profile_languages()
-        if engine is None:
-            raise WinRTUnavailableError(
-                "Windows OCR language not available. Install the language pack via Windows Settings."
-            )
+        engine = _ocr_engine(language)
 
         total_pages = len(doc)
         count = min(total_pages, max_pages) if max_pages else total_pages
+        pending = renderer.submit(_render_page, doc, 0, matrix) if count else None
+        word_rect: Optional[Callable[[Any], Optional[_RectProtocol]]] = None
+        line_rect: Optional[Callable[[Any], Optional[_RectProtocol]]] = None
         for index in range(count):
-            page = doc.load_page(index)
-            matrix = fitz.Matrix(scale, scale)
-            pix = page.get_pixmap(matrix=matrix, alpha=False)
-            image = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
-            bitmap = asyncio.run(_pil_to_software_bitmap(image))
-            result = asyncio.run(_recognize_bitmap(engine, bitmap))
+            image, rotation = pending.result()
+            if index + 1 < count:
+                pending = renderer.submit(_render_page, doc, index + 1, matrix)
+            result = loop.run_until_complete(_ocr_image(engine, image))
 
             words: List[OCRWord] = []
             lines: List[OCRLine] = []
             for line in result.lines:
                 line_words: List[OCRWord] = []
                 for word in line.words:
-                    rect = _extract_rect(word)
+                    if word_rect is None:
+                        word_rect = _rect_reader(word)
+                    rect = word_rect(word)
                     if rect is None:
                         continue
                     bbox = (rect.x, rect.y, rect.width, rect.height)
@@ -303,7 +444,9 @@ def run_winrt_ocr(
                     words.append(word_obj)
                     line_words.append(word_obj)
 
-                line_rect_obj = _extract_rect(line)
+                if line_rect is None:
+                    line_rect = _rect_reader(line)
+                line_rect_obj = line_rect(line)
                 if line_rect_obj is None and line_words:
                     xs = [w.bbox[0] for w in line_words]
                     ys = [w.bbox[1] for w in line_words]
@@ -336,13 +479,22 @@ def run_winrt_ocr(
             pages.append(
                 OCRPage(
                     index=index,
-                    width_px=pix.width,
-                    height_px=pix.height,
-                    rotation=page.rotation,
+                    width_px=image.width,
+                    height_px=image.height,
+                    rotation=rotation,
                     words=words,
                     lines=lines,
                 )
             )
     finally:
+        renderer.shutdown(wait=True, cancel_futures=True)
+        loop.close()
         doc.close()
     return pages
+
+
+def _render_page(doc: fitz.Document, index: int, matrix: fitz.Matrix) -> Tuple[Image.Image, int]:
+    """Render one page to an RGB image; returns the image and the page rotation."""
+    page = doc.load_page(index)
+    pix = page.get_pixmap(matrix=matrix, alpha=False)
+    return Image.frombytes("RGB", (pix.width, pix.height), pix.samples), page.rotation
@@ -2,27 +2,46 @@
 
 from __future__ import annotations
 
+import bisect
+import io
+import itertools
 import json
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import fitz  # type: ignore
+import numpy as np
 
-from .debug import draw_debug_overlay, draw_visible_text
-from .fonts import register_font
-from .geometry import MappingConfig, Rect, map_bbox_to_pdf
+from .debug import draw_debug_overlays, draw_visible_texts
+from .fonts import load_font
+from .geometry import MappingConfig, Rect, map_bboxes_to_pdf
+from .jsonstream import array_end, array_item
 from .ocr_io import OCRLine, OCRPage, OCRWord
-from .text_utils import dehyphenize, normalize_token
+from .text_utils import dehyphenize_spans, normalize_token
 
 logger = logging.getLogger(__name__)
 
 ALIGN_AUTO = "auto"
 ALIGN_PAGE = "page"
 
+# Below this page count, worker start-up costs more than the overlay work it spreads.
+PARALLEL_MIN_PAGES = 4
 
-@dataclass
+# Debug boxes cycle through these colours in token order.
+_DEBUG_COLORS = (
+    (1.0, 0.2, 0.2),
+    (0.2, 1.0, 0.2),
+    (0.2, 0.5, 1.0),
+    (1.0, 0.7, 0.2),
+    (0.8, 0.2, 1.0),
+)
+
+
+@dataclass(slots=True)
 class OverlaySettings:
     method: str = "invisible"
     granularity: str = "word"
@@ -43,6 +62,11 @@ class OverlaySettings:
     deskew: float = 0.0
     calibrate: int = 0
     dump_debug_json: Optional[Path] = None
+    jobs: int = 1  # 0 = one worker per CPU
+    # None = auto: invisible overlays use built-in Helvetica for pages whose text it can encode.
+    embed_font: Optional[bool] = None
+    # Full garbage collection and deflate of every stream on save: smaller file, slower save.
+    compact_output: bool = False
 
 
 @dataclass
@@ -55,28 +79,224 @@ class AlignmentInfo:
     source: str = ""
 
 
+class _DebugJsonWriter:
+    """Write debug mapping entries to a JSON array file as they are produced.
+
+    The file matches ``json.dumps(entries, ensure_ascii=False, indent=2)`` without holding
+    every entry in memory; ``append``/``extend`` mirror the list the overlay would fill.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = path.open("w", encoding="utf-8")
+        self._handle.write("[")
+        self._count = 0
+
+    def append(self, entry: Dict[str, object]) -> None:
+        text = json.dumps(entry, ensure_ascii=False, indent=2)
+        self._handle.write(array_item(text, 1, first=not self._count))
+        self._count += 1
+
+    def extend(self, entries: Iterable[Dict[str, object]]) -> None:
+        for entry in entries:
+            self.append(entry)
+
+    def close(self) -> None:
+        self._handle.write(array_end(self._count, 1))
+        self._handle.close()
+
+
+# A list in worker processes, where entries are shipped back to the parent per chunk.
+DebugSink = Union[List[Dict[str, object]], _DebugJsonWriter]
+
+
 def apply_text_overlay(
     pdf_path: Path,
-    pages: Sequence[OCRPage],
+    pages: Iterable[OCRPage],
     output_path: Path,
     settings: OverlaySettings,
 ) -> None:
-    """Insert normalized OCR text into a PDF using precise alignment."""
+    """Insert normalized OCR text into a PDF using precise alignment.
+
+    ``pages`` is consumed once and may be a lazy iterator such as ``iter_ocr_json``. When
+    an index repeats, its last entry wins.
+    """
+    pages = _unique_pages(pages)
+    normalize_token.cache_clear()
     doc = fitz.open(pdf_path)
-    font_name = register_font(doc, settings.font_path)
-    logger.info("Using font '%s' for OCR overlay.", font_name)
+    page_count = len(doc)
+    debug_payload: DebugSink = []
+    if settings.dump_debug_json:
+        debug_payload = _DebugJsonWriter(settings.dump_debug_json)
 
-    page_map = {page.index: page for page in pages}
-    debug_payload: List[Dict[str, object]] = []
+    jobs = settings.jobs or os.cpu_count() or 1
+    merged = jobs > 1 and page_count >= PARALLEL_MIN_PAGES
+    try:
+        if merged:
+            overlaid = _overlay_parallel(doc, pdf_path, pages, settings, jobs, debug_payload)
+        else:
+            overlaid = len(_overlay_pages(doc, pages, _font_selector(settings), settings, debug_payload))
+    finally:
+        if isinstance(debug_payload, _DebugJsonWriter):
+            debug_payload.close()
+    if settings.dump_debug_json:
+        logger.info("Dumped debug mapping to %s", settings.dump_debug_json)
 
-    for index in range(len(doc)):
-        fitz_page = doc.load_page(index)
-        ocr_page = page_map.get(index)
-        if ocr_page is None:
-            logger.debug("Skipping page %d (no OCR data).", index)
+    logger.info("Overlaid OCR text on %d of %d page(s).", overlaid, page_count)
+    if overlaid:
+        _subset_fonts(doc)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Token normalization cache: %s", normalize_token.cache_info())
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    repack = settings.compact_output and not settings.pdfa and _pikepdf_available()
+    # Kept in memory: the PDF/A and repack paths hand the bytes straight to pikepdf.
+    pdf_bytes = doc.tobytes(**_save_options(settings, merged, repack))
+    doc.close()
+
+    if settings.pdfa:
+        _attempt_pdfa_conversion(pdf_bytes, output_path, settings.compact_output)
+    elif repack:
+        _repack_with_pikepdf(pdf_bytes, output_path)
+    else:
+        output_path.write_bytes(pdf_bytes)
+        logger.info("Saved searchable PDF to %s", output_path)
+
+
+def _unique_pages(pages: Iterable[OCRPage]) -> List[OCRPage]:
+    """Return one entry per page index, keeping the last one, so no page gets two text layers."""
+    return list({ocr_page.index: ocr_page for ocr_page in pages}.values())
+
+
+def _subset_fonts(doc: fitz.Document) -> None:
+    """Shrink embedded fonts to the glyphs the overlay used; a CJK font file can be tens of MB."""
+    try:
+        doc.subset_fonts()
+    except Exception as exc:  # pragma: no cover - depends on the PyMuPDF build
+        logger.warning("Font subsetting failed (%s); keeping full embedded fonts.", exc)
+
+
+def _save_options(settings: OverlaySettings, merged: bool, repack: bool = False) -> Dict[str, object]:
+    """Return ``Document.save`` options; by default only the streams the overlay wrote are deflated."""
+    if repack:
+        # pikepdf compresses the remaining plain streams and packs objects on its own save.
+        return {"garbage": 4}
+    if settings.compact_output:
+        return {"deflate": True, "garbage": 4}
+    # Overlays from worker chunks each carry their own copy of the font; only garbage=4
+    # compares stream contents and folds them back into one.
+    return {
+        "deflate": True,
+        "deflate_images": False,
+        "deflate_fonts": False,
+        "garbage": 4 if merged else 2,
+        "clean": False,
+    }
+
+
+def _fixed_font_choice(settings: OverlaySettings) -> Optional[bool]:
+    """Return whether every page uses the font file, or ``None`` when it is decided per page."""
+    if settings.embed_font is not None:
+        return settings.embed_font
+    if settings.method != "invisible" or settings.visible_qa or settings.debug_overlay:
+        return True
+    return None
+
+
+def _needs_font_file(ocr_page: OCRPage, settings: OverlaySettings) -> bool:
+    """Return True when built-in Helvetica cannot encode the page's text as it will be written."""
+    texts = ocr_page.word_texts if settings.granularity != "line" else [line.text for line in ocr_page.lines]
+    # Check the normalized text: NFKC can turn Latin-1 input such as "µ½" into glyphs
+    # Helvetica cannot encode. normalize_token is cached, so the overlay pass reuses these results.
+    keep_spaces, cjk_join = settings.keep_spaces, settings.cjk_join
+    try:
+        "".join(normalize_token(text, keep_spaces, cjk_join) for text in texts).encode("latin-1")
+    except UnicodeEncodeError:
+        return True
+    return False
+
+
+def _font_file_pages(pages: Iterable[OCRPage], settings: OverlaySettings) -> Set[int]:
+    """Return the indices of pages a serial run writes with the font file.
+
+    That is every page from the first one that needs it onwards, in iteration order.
+    """
+    font_pages: Set[int] = set()
+    for ocr_page in pages:
+        if font_pages or _needs_font_file(ocr_page, settings):
+            font_pages.add(ocr_page.index)
+    return font_pages
+
+
+def _font_selector(
+    settings: OverlaySettings,
+    font_pages: Optional[Set[int]] = None,
+) -> Callable[[OCRPage], fitz.Font]:
+    """Return a per-page font chooser that embeds the overlay font only when a page needs it.
+
+    Invisible text is never drawn, so Helvetica's built-in encoding is enough whenever the
+    page's normalized text is Latin-1; the font file is loaded and embedded from the first
+    page that is not. Worker processes pass ``font_pages`` from :func:`_font_file_pages` so
+    the choice does not depend on which chunk a page landed in.
+    """
+    fixed = _fixed_font_choice(settings)
+    if fixed:
+        font = load_font(settings.font_path)
+        logger.info("Using font '%s' for OCR overlay.", font.name)
+        return lambda ocr_page: font
+    helv = fitz.Font("helv")
+    if fixed is False:
+        logger.info("Using built-in font 'helv' for OCR overlay (--no-embed-font).")
+        return lambda ocr_page: helv
+
+    embedded: List[fitz.Font] = []
+
+    def choose(ocr_page: OCRPage) -> fitz.Font:
+        if not embedded:
+            if font_pages is not None:
+                if ocr_page.index not in font_pages:
+                    return helv
+            elif not _needs_font_file(ocr_page, settings):
+                return helv
+            embedded.append(load_font(settings.font_path))
+            logger.info("Page %d needs non-Latin glyphs; using font '%s' from here on.", ocr_page.index, embedded[0].name)
+        return embedded[0]
+
+    return choose
+
+
+def _blank_like(target: fitz.Document, page: fitz.Page) -> fitz.Page:
+    """Append an empty page with ``page``'s boxes and rotation to ``target``."""
+    blank = target.new_page(width=page.mediabox.width, height=page.mediabox.height)
+    blank.set_mediabox(page.mediabox)
+    blank.set_cropbox(page.cropbox)
+    blank.set_rotation(page.rotation)
+    return blank
+
+
+def _overlay_pages(
+    doc: fitz.Document,
+    pages: Iterable[OCRPage],
+    font_for: Callable[[OCRPage], fitz.Font],
+    settings: OverlaySettings,
+    debug_payload: DebugSink,
+    target: Optional[fitz.Document] = None,
+) -> List[int]:
+    """Overlay ``pages`` onto ``doc`` and return the indices of the pages written.
+
+    With ``target``, each overlay is drawn on a blank copy of its page appended to ``target``
+    instead, in the order of the returned indices; alignment still comes from ``doc``.
+    """
+    page_count = len(doc)
+    overlaid: List[int] = []
+    for ocr_page in pages:
+        index = ocr_page.index
+        if not 0 <= index < page_count:
+            logger.debug("Skipping OCR page %d (not present in PDF).", index)
             continue
+        fitz_page = doc.load_page(index)
+        page_rect = Rect(*fitz_page.bound())
 
-        alignment = _determine_alignment(doc, fitz_page, ocr_page, settings)
+        alignment = _determine_alignment(fitz_page, ocr_page, settings, page_rect)
         logger.info(
             "Page %d: rect=%s px_size=(%.1f, %.1f) rotation=%d source=%s",
             index,
@@ -87,38 +307,92 @@ def apply_text_overlay(
             alignment.source,
         )
         _overlay_single_page(
-            fitz_page=fitz_page,
+            fitz_page=fitz_page if target is None else _blank_like(target, fitz_page),
             ocr_page=ocr_page,
-            font_name=font_name,
+            font=font_for(ocr_page),
             alignment=alignment,
+            page_rect=page_rect,
             settings=settings,
             debug_payload=debug_payload,
         )
+        overlaid.append(index)
+    return overlaid
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    temp_path = output_path.with_suffix(".tmp.pdf")
-    doc.save(temp_path, deflate=True, garbage=4)
-    doc.close()
 
-    if settings.pdfa:
-        _attempt_pdfa_conversion(temp_path, output_path)
-    else:
-        temp_path.replace(output_path)
-        logger.info("Saved searchable PDF to %s", output_path)
-
-    if settings.dump_debug_json:
-        settings.dump_debug_json.parent.mkdir(parents=True, exist_ok=True)
-        settings.dump_debug_json.write_text(json.dumps(debug_payload, ensure_ascii=False, indent=2), encoding="utf-8")
-        logger.info("Dumped debug mapping to %s", settings.dump_debug_json)
+def _overlay_parallel(
+    doc: fitz.Document,
+    pdf_path: Path,
+    pages: Iterable[OCRPage],
+    settings: OverlaySettings,
+    jobs: int,
+    debug_payload: DebugSink,
+) -> int:
+    """Overlay contiguous page ranges in worker processes and stamp the results onto ``doc``.
+
+    Workers draw each overlay on a blank page with the source page's boxes and rotation; the
+    parent places it over the original page as a form XObject. The source document itself is
+    kept, so links, destinations, page labels, forms and attachments survive unchanged.
+    """
+    page_count = len(doc)
+    jobs = min(jobs, page_count)
+    starts = [page_count * chunk // jobs for chunk in range(jobs)]
+    bounds = list(zip(starts, starts[1:] + [page_count]))
+    buckets: List[List[OCRPage]] = [[] for _ in bounds]
+    ordered: List[OCRPage] = []
+    for ocr_page in pages:
+        if 0 <= ocr_page.index < page_count:
+            buckets[bisect.bisect_right(starts, ocr_page.index) - 1].append(ocr_page)
+            ordered.append(ocr_page)
+    font_pages = _font_file_pages(ordered, settings) if _fixed_font_choice(settings) is None else None
+    del ordered
+
+    logger.info("Overlaying %d page(s) with %d worker process(es).", page_count, jobs)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(_overlay_range_worker, pdf_path, bucket, settings, font_pages)
+            for bucket in buckets
+            if bucket  # A chunk with no OCR pages would be an empty PDF, which cannot be saved.
+        ]
+        # Chunks are applied in page order and each result is dropped once it is applied.
+        overlaid = 0
+        futures.reverse()
+        while futures:
+            chunk_bytes, indices, chunk_debug = futures.pop().result()
+            with fitz.open("pdf", chunk_bytes) as chunk:
+                for position, index in enumerate(indices):
+                    page = doc.load_page(index)
+                    page.show_pdf_page(page.rect, chunk, position, overlay=True)
+            debug_payload.extend(chunk_debug)
+            overlaid += len(indices)
+    return overlaid
+
+
+def _overlay_range_worker(
+    pdf_path: Path,
+    pages: List[OCRPage],
+    settings: OverlaySettings,
+    font_pages: Optional[Set[int]],
+) -> Tuple[bytes, List[int], List[Dict[str, object]]]:
+    """Process-pool entry point: return overlay-only pages as PDF bytes and their source indices."""
+    doc = fitz.open(pdf_path)
+    target = fitz.open()
+    try:
+        debug_payload: List[Dict[str, object]] = []
+        indices = _overlay_pages(doc, pages, _font_selector(settings, font_pages), settings, debug_payload, target)
+        return target.tobytes(), indices, debug_payload
+    finally:
+        target.close()
+        doc.close()
 
 
 def _determine_alignment(
-    doc: fitz.Document,
     page: fitz.Page,
     ocr_page: OCRPage,
     settings: OverlaySettings,
+    page_rect: Optional[Rect] = None,
 ) -> AlignmentInfo:
-    page_rect = Rect(*page.bound().xf)  # type: ignore[arg-type]
+    if page_rect is None:
+        page_rect = Rect(*page.bound())
     rotation = page.rotation
     if settings.rotate_override is not None:
         rotation = settings.rotate_override
@@ -141,17 +415,20 @@ def _determine_alignment(
         except ValueError as exc:
             raise ValueError("--align image:<xref> expects numeric xref") from exc
 
-    image_entries = page.get_images(full=True)
-    candidates: List[Tuple[int, Rect]] = []
-    for entry in image_entries:
-        xref = entry[0]
-        if xref_target is not None and xref_target != xref:
-            continue
-        rects = page.get_image_rects(xref)
-        if not rects:
+    # One content-stream pass places every image; get_image_rects(xref) repeats that pass
+    # per image. The same records carry each image's pixel size.
+    rects_by_xref: Dict[int, List[Rect]] = {}
+    sizes_by_xref: Dict[int, Tuple[float, float]] = {}
+    for info in page.get_image_info(xrefs=True):
+        xref = info["xref"]
+        if not xref or (xref_target is not None and xref_target != xref):
             continue
-        largest_rect = max(rects, key=lambda r: r.width * r.height)
-        candidates.append((xref, Rect(*largest_rect)))
+        rects_by_xref.setdefault(xref, []).append(Rect(*info["bbox"]))
+        sizes_by_xref[xref] = (float(info["width"]), float(info["height"]))
+
+    candidates: List[Tuple[int, Rect]] = [
+        (xref, max(rects, key=lambda r: r.width * r.height)) for xref, rects in rects_by_xref.items()
+    ]
 
     if not candidates:
         logger.warning("No image rectangles found on page %d; falling back to page alignment.", page.number)
@@ -164,9 +441,7 @@ def _determine_alignment(
         chosen = max(candidates, key=lambda item: item[1].width * item[1].height)
     xref, image_rect = chosen
 
-    info = doc.extract_image(xref)
-    width_px = float(info.get("width", ocr_page.width_px or 0))
-    height_px = float(info.get("height", ocr_page.height_px or 0))
+    width_px, height_px = sizes_by_xref[xref]
     if width_px == 0 or height_px == 0:
         logger.warning("Image xref=%d missing pixel size metadata; using OCR JSON dimensions.", xref)
         width_px = ocr_page.width_px or 0.0
@@ -205,14 +480,15 @@ def _page_dimensions_px(ocr_page: OCRPage, settings: OverlaySettings) -> Tuple[f
 def _overlay_single_page(
     fitz_page: fitz.Page,
     ocr_page: OCRPage,
-    font_name: str,
+    font: fitz.Font,
     alignment: AlignmentInfo,
+    page_rect: Rect,
     settings: OverlaySettings,
-    debug_payload: List[Dict[str, object]],
+    debug_payload: DebugSink,
 ) -> None:
     mapping = MappingConfig(
         image_rect=alignment.rect,
-        page_rect=Rect(*fitz_page.bound().xf),  # type: ignore[arg-type]
+        page_rect=page_rect,
         width_px=alignment.width_px,
         height_px=alignment.height_px,
         offset_pt=settings.offset_pt,
@@ -221,79 +497,134 @@ def _overlay_single_page(
         deskew=settings.deskew,
     )
 
-    entries = list(_iter_granularity(ocr_page, settings.granularity))
+    texts, boxes = _granularity_columns(ocr_page, settings.granularity)
+    keep_spaces, cjk_join = settings.keep_spaces, settings.cjk_join
+    texts = [normalize_token(text, keep_spaces, cjk_join) for text in texts]
     if settings.dehyphen and settings.granularity == "line":
-        normalized_lines = [
-            normalize_token(text, settings.keep_spaces, settings.cjk_join) for text, _ in entries
-        ]
-        normalized_lines = dehyphenize(normalized_lines)
-        entries = list(zip(normalized_lines, [bbox for _, bbox in entries]))
+        # Joined lines are placed at the box of the line they start on.
+        texts, starts = dehyphenize_spans(texts)
+        boxes = boxes[starts]
+    if not texts:
+        return
 
-    samples: List[Dict[str, object]] = []
-    color_cycle = _color_cycle()
     method = settings.method
     if settings.visible_qa:
         method = "visible"
 
     render_mode, color, opacity = _resolve_render_mode(method)
 
-    for idx, (raw_text, bbox) in enumerate(entries):
-        text = normalize_token(raw_text, settings.keep_spaces, settings.cjk_join)
-        if not text:
-            continue
-        try:
-            placement = map_bbox_to_pdf(
-                bbox=bbox,
-                baseline_ratio=settings.baseline_ratio,
-                font_scale=settings.font_scale,
-                config=mapping,
-            )
-        except ValueError as exc:
-            logger.debug("Skipping bbox %s due to %s", bbox, exc)
-            continue
+    keep = np.fromiter(map(bool, texts), dtype=bool, count=len(texts))
+    if not keep.all():
+        indices = np.flatnonzero(keep).tolist()
+        if not indices:
+            return
+        texts = [texts[idx] for idx in indices]
+        boxes = boxes[keep]
+    else:
+        indices = range(len(texts))
 
-        if idx < settings.calibrate:
-            samples.append(
-                {
-                    "text": text,
-                    "bbox_px": [float(value) for value in bbox],
-                    "anchor_pt": placement.anchor,
-                    "font_size": placement.font_size,
-                }
-            )
+    try:
+        placements = map_bboxes_to_pdf(
+            boxes,
+            baseline_ratio=settings.baseline_ratio,
+            font_scale=settings.font_scale,
+            config=mapping,
+        )
+    except ValueError as exc:
+        logger.debug("Skipping page %d due to %s", ocr_page.index, exc)
+        return
 
-        rect = fitz.Rect(placement.rect.x0, placement.rect.y0, placement.rect.x1, placement.rect.y1)
-        fitz_point = fitz.Point(*placement.anchor)
+    rotate = mapping.rotation + mapping.deskew
+    # Upright text is batched into one TextWriter per page; a TextWriter cannot rotate
+    # individual runs, so rotated pages queue insert_text calls on one Shape per page.
+    writer = None
+    if rotate % 360 == 0:
+        writer = fitz.TextWriter(fitz_page.rect, opacity=1 if opacity is None else opacity, color=color)
+    options: Dict[str, object] = {}
+    if writer is None:
+        font_name = "helv"
+        if not font.name.startswith("Helvetica"):
+            font_name = "OCRText"
+            fitz_page.insert_font(fontname=font_name, fontbuffer=font.buffer)
+        # Only the font size varies per entry; everything else is fixed for the page.
         options = {
             "fontname": font_name,
-            "fontsize": placement.font_size,
-            "rotate": placement.rotate,
+            "rotate": rotate,
             "render_mode": render_mode,
-            "overlay": True,
         }
         if color is not None:
             options["color"] = color
         if opacity is not None:
-            options["opacity"] = opacity
-
-        fitz_page.insert_text(fitz_point, text, **options)
-
-        if method == "visible":
-            draw_visible_text(fitz_page, rect, placement.rotate)
+            options["fill_opacity"] = opacity
+    anchor_xs = placements["anchor_x"].tolist()
+    anchor_ys = placements["anchor_y"].tolist()
+    font_sizes = placements["font_size"].tolist()
+
+    # The insertion loops carry no diagnostics; QA, debug, calibration and dump output
+    # are produced in separate passes below, only when enabled.
+    make_point = fitz.Point
+    if writer is not None:
+        append = writer.append
+        for text, anchor_x, anchor_y, font_size in zip(texts, anchor_xs, anchor_ys, font_sizes):
+            append(make_point(anchor_x, anchor_y), text, font=font, fontsize=font_size)
+        writer.write_text(fitz_page, render_mode=render_mode, overlay=True)
+    else:
+        # Page.insert_text would build and commit a Shape (a new content stream) per entry.
+        shape = fitz_page.new_shape()
+        insert_text = shape.insert_text
+        for text, anchor_x, anchor_y, font_size in zip(texts, anchor_xs, anchor_ys, font_sizes):
+            insert_text(make_point(anchor_x, anchor_y), text, fontsize=font_size, **options)
+        shape.commit(overlay=True)
+
+    draw_qa = method == "visible"
+    dump_debug = settings.dump_debug_json is not None
+    if not (draw_qa or settings.debug_overlay or dump_debug or settings.calibrate):
+        return
 
+    rect_columns = list(
+        zip(
+            placements["x0"].tolist(),
+            placements["y0"].tolist(),
+            placements["x1"].tolist(),
+            placements["y1"].tolist(),
+        )
+    )
+    if draw_qa or settings.debug_overlay:
+        shape_rects = [fitz.Rect(*rect) for rect in rect_columns]
+        if draw_qa:
+            draw_visible_texts(fitz_page, shape_rects)
         if settings.debug_overlay:
-            debug_color = next(color_cycle)
-            draw_debug_overlay(fitz_page, rect, debug_color)
+            draw_debug_overlays(fitz_page, shape_rects, itertools.cycle(_DEBUG_COLORS))
+
+    if not (dump_debug or settings.calibrate):
+        return
+    samples: List[Dict[str, object]] = []
+    calibrate = settings.calibrate
+    for idx, text, bbox, anchor_x, anchor_y, rect, font_size in zip(
+        indices, texts, boxes.tolist(), anchor_xs, anchor_ys, rect_columns, font_sizes
+    ):
+        anchor = (anchor_x, anchor_y)
+        if idx < calibrate:
+            samples.append(
+                {
+                    "text": text,
+                    "bbox_px": bbox,
+                    "anchor_pt": anchor,
+                    "font_size": font_size,
+                }
+            )
+        elif not dump_debug:
+            break
 
-        if settings.dump_debug_json is not None:
+        if dump_debug:
             debug_payload.append(
                 {
-                    "page": fitz_page.number,
+                    "page": ocr_page.index,
                     "text": text,
-                    "bbox_px": [float(value) for value in bbox],
-                    "rect_pt": [placement.rect.x0, placement.rect.y0, placement.rect.x1, placement.rect.y1],
-                    "anchor_pt": placement.anchor,
-                    "font_size": placement.font_size,
+                    "bbox_px": bbox,
+                    "rect_pt": rect,
+                    "anchor_pt": anchor,
+                    "font_size": font_size,
                 }
             )
 
@@ -303,27 +634,13 @@ def _overlay_single_page(
             logger.info("  %s -> anchor %s font %.2f", sample["text"], sample["anchor_pt"], sample["font_size"])
 
 
-def _iter_granularity(page: OCRPage, granularity: str) -> Iterable[Tuple[str, Tuple[float, float, float, float]]]:
+def _granularity_columns(page: OCRPage, granularity: str) -> Tuple[List[str], np.ndarray]:
+    """Return the page's texts and their ``(N, 4)`` float64 x/y/w/h boxes at ``granularity``."""
     if granularity == "line":
-        for line in page.lines:
-            yield line.text, line.bbox
-    else:
-        for word in page.words:
-            yield word.text, word.bbox
-
-
-def _color_cycle() -> Iterable[Tuple[float, float, float]]:
-    colors = [
-        (1.0, 0.2, 0.2),
-        (0.2, 1.0, 0.2),
-        (0.2, 0.5, 1.0),
-        (1.0, 0.7, 0.2),
-        (0.8, 0.2, 1.0),
-    ]
-    idx = 0
-    while True:
-        yield colors[idx % len(colors)]
-        idx += 1
+        lines = page.lines
+        boxes = np.asarray([line.bbox for line in lines], dtype=np.float64).reshape(-1, 4)
+        return [line.text for line in lines], boxes
+    return page.word_texts, page.word_bboxes
 
 
 def _resolve_render_mode(method: str) -> Tuple[int, Optional[Tuple[float, float, float]], Optional[float]]:
@@ -334,21 +651,45 @@ def _resolve_render_mode(method: str) -> Tuple[int, Optional[Tuple[float, float,
     return 3, None, None
 
 
-def _attempt_pdfa_conversion(temp_path: Path, output_path: Path) -> None:
+def _pikepdf_available() -> bool:
+    try:
+        import pikepdf  # type: ignore  # noqa: F401
+    except ImportError:
+        logger.warning("pikepdf not available; saving with PyMuPDF compression only.")
+        return False
+    return True
+
+
+def _pikepdf_save_options(compact: bool) -> Dict[str, object]:
+    """Return ``pikepdf.Pdf.save`` options; compact output also packs objects into object streams."""
+    if not compact:
+        return {}
+    import pikepdf  # type: ignore
+
+    # Streams MuPDF already deflated are copied as-is (recompress_flate stays off).
+    return {"compress_streams": True, "object_stream_mode": pikepdf.ObjectStreamMode.generate}
+
+
+def _repack_with_pikepdf(pdf_bytes: bytes, output_path: Path) -> None:
+    import pikepdf  # type: ignore
+
+    with pikepdf.open(io.BytesIO(pdf_bytes)) as pdf:
+        pdf.save(output_path, **_pikepdf_save_options(True))
+    logger.info("Saved compacted searchable PDF to %s", output_path)
+
+
+def _attempt_pdfa_conversion(pdf_bytes: bytes, output_path: Path, compact: bool = False) -> None:
     try:
         import pikepdf  # type: ignore
     except ImportError:
         logger.warning("pikepdf not available; exporting regular PDF instead of PDF/A-2b.")
-        temp_path.replace(output_path)
+        output_path.write_bytes(pdf_bytes)
         return
 
-    try:
-        with pikepdf.open(temp_path) as pdf:
-            try:
-                pdf.make_pdfa(output_path, compliance=pikepdf.Pdf.PDFA_2B, icc_profile=pikepdf.sRGB_PROFILE)  # type: ignore[attr-defined]
-                logger.info("Saved PDF/A-2b (best effort) file to %s", output_path)
-            except Exception as exc:
-                logger.warning("Failed to enforce PDF/A-2b (%s); emitting regular PDF.", exc)
-                pdf.save(output_path)
-    finally:
-        temp_path.unlink(missing_ok=True)
+    with pikepdf.open(io.BytesIO(pdf_bytes)) as pdf:
+        try:
+            pdf.make_pdfa(output_path, compliance=pikepdf.Pdf.PDFA_2B, icc_profile=pikepdf.sRGB_PROFILE)  # type: ignore[attr-defined]
+            logger.info("Saved PDF/A-2b (best effort) file to %s", output_path)
+        except Exception as exc:
+            logger.warning("Failed to enforce PDF/A-2b (%s); emitting regular PDF.", exc)
+            pdf.save(output_path, **_pikepdf_save_options(compact))
@@ -2,34 +2,62 @@
 
 from __future__ import annotations
 
+import functools
+import re
 import unicodedata
-from typing import Iterable, List
+from typing import Iterable, List, Tuple
+
+# Same ranges as is_cjk(); a single whitespace character between two CJK characters is dropped.
+_CJK_CLASS = "[\u4e00-\u9fff\u3400-\u4dbf\U00020000-\U0002ceaf\uf900-\ufaff]"
+_CJK_SPACE_RE = re.compile(rf"(?<={_CJK_CLASS})\s(?={_CJK_CLASS})")
+
+# Zero-width space becomes a regular space; joiners and BOM are dropped. One translate pass.
+_ZERO_WIDTH_TABLE = str.maketrans({"\u200b": " ", "\u200c": None, "\u200d": None, "\ufeff": None})
+
+
+def _build_cjk_table() -> bytes:
+    table = bytearray(0x10000)
+    for start, stop in (
+        (0x4E00, 0xA000),  # CJK Unified Ideographs
+        (0x3400, 0x4DC0),  # Extension A
+        (0xF900, 0xFB00),  # Compatibility Ideographs
+    ):
+        table[start:stop] = b"\x01" * (stop - start)
+    return bytes(table)
+
+
+# One flag byte per BMP code point; only Extension B-D lies outside the BMP.
+_CJK_TABLE = _build_cjk_table()
 
 
 def is_cjk(char: str) -> bool:
     """Return True if the character belongs to the CJK ranges."""
     code = ord(char)
-    return (
-        0x4E00 <= code <= 0x9FFF  # CJK Unified Ideographs
-        or 0x3400 <= code <= 0x4DBF  # Extension A
-        or 0x20000 <= code <= 0x2CEAF  # Extension B-D
-        or 0xF900 <= code <= 0xFAFF  # Compatibility Ideographs
-    )
+    if code < 0x10000:
+        return _CJK_TABLE[code] == 1
+    return 0x20000 <= code <= 0x2CEAF  # Extension B-D
 
 
+@functools.lru_cache(maxsize=65536)
 def normalize_token(
     text: str,
     keep_spaces: bool = False,
     cjk_join: bool = False,
 ) -> str:
-    """Apply Unicode normalization, zero-width removal, and optional spacing tweaks."""
-    normalized = unicodedata.normalize("NFKC", text or "")
-    normalized = (
-        normalized.replace("\u200b", " ")
-        .replace("\u200c", "")
-        .replace("\u200d", "")
-        .replace("\ufeff", "")
-    )
+    """Apply Unicode normalization, zero-width removal, and optional spacing tweaks.
+
+    OCR output repeats tokens heavily, so results are memoised; ``apply_text_overlay`` clears
+    the cache per document.
+    """
+    if not text:
+        return ""
+    if text.isascii():
+        # NFKC and the zero-width table leave ASCII unchanged, and there is no CJK to join.
+        if keep_spaces or (text.isprintable() and text[0] != " " and text[-1] != " " and "  " not in text):
+            return text
+        return " ".join(text.split())
+
+    normalized = unicodedata.normalize("NFKC", text).translate(_ZERO_WIDTH_TABLE)
     if not keep_spaces:
         normalized = " ".join(normalized.split())
 
@@ -39,38 +67,44 @@ def normalize_token(
 
 
 def _trim_cjk_spaces(text: str) -> str:
-    if not text:
-        return text
-    chars: List[str] = []
-    length = len(text)
-    for idx, char in enumerate(text):
-        if char.isspace():
-            prev_char = text[idx - 1] if idx > 0 else ""
-            next_char = text[idx + 1] if idx + 1 < length else ""
-            if is_cjk(prev_char) and is_cjk(next_char):
-                continue
-        chars.append(char)
-    return "".join(chars)
+    return _CJK_SPACE_RE.sub("", text)
 
 
 def dehyphenize(lines: Iterable[str]) -> List[str]:
     """Join hyphenated line endings according to simple rules."""
+    return dehyphenize_spans(lines)[0]
+
+
+def dehyphenize_spans(lines: Iterable[str]) -> Tuple[List[str], List[int]]:
+    """Like :func:`dehyphenize`, also returning the input index each output line starts at."""
     result: List[str] = []
-    buffer = ""
-    for line in lines:
+    starts: List[int] = []
+    # Segments of the paragraph being joined; concatenated once on flush.
+    parts: List[str] = []
+    start = 0
+    for index, line in enumerate(lines):
         segment = line.strip()
         if not segment:
-            if buffer:
-                result.append(buffer)
-                buffer = ""
+            if parts:
+                result.append("".join(parts))
+                starts.append(start)
+                parts.clear()
             result.append("")
+            starts.append(index)
             continue
-        if buffer.endswith("-") and segment and segment[0].islower():
-            buffer = buffer[:-1] + segment
-            continue
-        if buffer:
-            result.append(buffer)
-        buffer = segment
-    if buffer:
-        result.append(buffer)
-    return result
+        if parts:
+            tail = parts[-1]
+            head = segment[0]
+            if tail[-1] == "-" and ("a" <= head <= "z" or (head > "\x7f" and head.islower())):
+                parts[-1] = tail[:-1]
+                parts.append(segment)
+                continue
+            result.append("".join(parts))
+            starts.append(start)
+            parts.clear()
+        parts.append(segment)
+        start = index
+    if parts:
+        result.append("".join(parts))
+        starts.append(start)
+    return result, starts
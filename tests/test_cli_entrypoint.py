@@ -15,3 +15,41 @@ def test_cli_help():
     result = runner.invoke(main, ["--help"])
     assert result.exit_code == 0
     assert "Usage" in result.output
+
+
+def test_cli_rejects_malformed_offset(tmp_path):
+    pdf_path = tmp_path / "input.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n")
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        ["--pdf", str(pdf_path), "--out", str(tmp_path / "out.pdf"), "--offset-pt", "1;2"],
+    )
+    assert result.exit_code == 2
+    assert "comma-separated" in result.output
+
+
+def test_cli_requires_exactly_one_input(tmp_path):
+    pdf_path = tmp_path / "input.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n")
+    runner = CliRunner()
+    result = runner.invoke(main, ["--out", str(tmp_path / "out.pdf")])
+    assert result.exit_code == 2
+    result = runner.invoke(
+        main,
+        ["--pdf", str(pdf_path), "--pdf-dir", str(tmp_path), "--out", str(tmp_path / "out")],
+    )
+    assert result.exit_code == 2
+    assert "--pdf-dir" in result.output
+
+
+def test_cli_checks_out_kind_per_mode(tmp_path):
+    pdf_path = tmp_path / "input.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n")
+    runner = CliRunner()
+    result = runner.invoke(main, ["--pdf", str(pdf_path), "--out", str(tmp_path)])
+    assert result.exit_code == 2
+    assert "--out" in result.output and "is a directory" in result.output
+    result = runner.invoke(main, ["--pdf-dir", str(tmp_path), "--out", str(pdf_path)])
+    assert result.exit_code == 2
+    assert "--out" in result.output and "is a file" in result.output
@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from pdf_text_overlay import fonts
+
+
+@pytest.fixture
+def packaged_font_dir(tmp_path: Path, monkeypatch):
+    font_dir = tmp_path / "fonts"
+    font_dir.mkdir()
+    (font_dir / "Fallback.ttf").write_bytes(fitz.Font("cjk").buffer)
+    (font_dir / "README.txt").write_text("not a font")
+    monkeypatch.setattr(fonts.resources, "files", lambda package: tmp_path)
+    fonts.packaged_font.cache_clear()
+    fonts.resolve_font.cache_clear()
+    yield font_dir
+    fonts.packaged_font.cache_clear()
+    fonts.resolve_font.cache_clear()
+
+
+def test_packaged_font_is_loaded_from_cached_bytes(packaged_font_dir: Path):
+    assert fonts.packaged_font()[0] == "Fallback.ttf"
+    # The resource may have been a temporary extraction; later loads must not need it.
+    (packaged_font_dir / "Fallback.ttf").unlink()
+    assert fonts.load_font(None).name == fitz.Font("cjk").name
+
+
+def test_resolve_font_returns_paths_only(packaged_font_dir: Path, monkeypatch):
+    monkeypatch.setattr(fonts, "_iter_system_fonts", lambda: ())
+    with pytest.raises(FileNotFoundError):
+        fonts.resolve_font(None)
+
+
+def test_explicit_font_path_wins(packaged_font_dir: Path, tmp_path: Path):
+    font_file = tmp_path / "explicit.ttf"
+    font_file.write_bytes(fitz.Font("cjk").buffer)
+    assert fonts.resolve_font(font_file) == font_file
+    assert fonts.load_font(font_file).name == fitz.Font("cjk").name
+
+
+def test_register_font_is_a_deprecated_wrapper(tmp_path: Path):
+    font_file = tmp_path / "explicit.ttf"
+    font_file.write_bytes(fitz.Font("cjk").buffer)
+    doc = fitz.open()
+    page = doc.new_page()
+    with pytest.deprecated_call():
+        font_name = fonts.register_font(doc, font_file)
+    page.insert_text((20, 50), "μ1⁄2", fontname=font_name)
+    assert "μ1⁄2" in page.get_text()
+    with pytest.deprecated_call():
+        assert fonts.register_font(doc, tmp_path / "missing.ttf") == "helv"
@@ -0,0 +1,102 @@
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from pdf_text_overlay import _kernels
+from pdf_text_overlay.geometry import (
+    MappingConfig,
+    Rect,
+    make_point_rotator,
+    make_rotator,
+    map_bbox_to_pdf,
+    map_bboxes_to_pdf,
+    rotate_rect,
+)
+
+
+def _config(rotation: int) -> MappingConfig:
+    return MappingConfig(
+        image_rect=Rect(10.0, 20.0, 590.0, 820.0),
+        page_rect=Rect(0.0, 0.0, 595.0, 842.0),
+        width_px=2000,
+        height_px=3000,
+        offset_pt=(1.5, -2.0),
+        scale_corr=(1.01, 0.99),
+        rotation=rotation,
+    )
+
+
+@pytest.mark.parametrize("use_kernel", [True, False])
+@pytest.mark.parametrize("rotation", [0, 90, 180, 270])
+def test_map_bboxes_to_pdf_matches_scalar(rotation: int, use_kernel: bool, monkeypatch):
+    if use_kernel and not _kernels.NUMBA_AVAILABLE:
+        pytest.skip("Numba not installed")
+    monkeypatch.setattr(_kernels, "NUMBA_AVAILABLE", use_kernel)
+    bboxes = [(100, 200, 400, 50), (0, 0, 1, 1), (1500, 2800, 300, 120)]
+    config = _config(rotation)
+    batch = map_bboxes_to_pdf(np.asarray(bboxes), baseline_ratio=0.2, font_scale=1.1, config=config)
+    assert all(column.dtype == np.float64 for column in batch.values())
+
+    for idx, bbox in enumerate(bboxes):
+        placement = map_bbox_to_pdf(bbox, baseline_ratio=0.2, font_scale=1.1, config=config)
+        assert batch["anchor_x"][idx] == pytest.approx(placement.anchor[0], abs=1e-3)
+        assert batch["anchor_y"][idx] == pytest.approx(placement.anchor[1], abs=1e-3)
+        assert batch["x0"][idx] == pytest.approx(placement.rect.x0, abs=1e-3)
+        assert batch["y0"][idx] == pytest.approx(placement.rect.y0, abs=1e-3)
+        assert batch["x1"][idx] == pytest.approx(placement.rect.x1, abs=1e-3)
+        assert batch["y1"][idx] == pytest.approx(placement.rect.y1, abs=1e-3)
+        assert batch["font_size"][idx] == pytest.approx(placement.font_size, abs=1e-3)
+
+
+
+@pytest.mark.parametrize("rotation", [0, 90, 180, 270])
+def test_compiled_kernels_match_python_exactly(rotation: int):
+    if not _kernels.NUMBA_AVAILABLE:
+        pytest.skip("Numba not installed")
+    rng = np.random.default_rng(rotation)
+    boxes = np.concatenate([rng.uniform(0.0, 3000.0, (64, 4)), [[5.0, 7.0, 0.0, 0.0]]])
+    args = (10.0, 820.0, 0.29, 0.2667, 1.5, -2.0, 0.2, 1.1, 595.0, 842.0, rotation)
+
+    compiled = _kernels.place_bboxes(boxes, *args)
+    reference = np.array([_kernels.place_bbox.py_func(*box, *args) for box in boxes]).T
+    np.testing.assert_array_equal(compiled, reference)
+
+
+def test_map_bboxes_to_pdf_rejects_invalid_config():
+    config = replace(_config(0), width_px=0)
+    with pytest.raises(ValueError):
+        map_bboxes_to_pdf(np.zeros((1, 4)), baseline_ratio=0.2, font_scale=1.0, config=config)
+
+
+@pytest.mark.parametrize("rotation", [0, 90, 180, 270, -90, 450])
+def test_make_rotator_matches_rotate_rect(rotation: int):
+    page = Rect(0.0, 0.0, 595.0, 842.0)
+    rect = Rect(10.0, 20.0, 110.0, 70.0)
+    assert make_rotator(rotation, page)(rect) == rotate_rect(rect, page, rotation)
+
+
+def test_rotators_reject_invalid_rotation_at_construction():
+    page = Rect(0.0, 0.0, 595.0, 842.0)
+    with pytest.raises(ValueError):
+        make_rotator(45, page)
+    with pytest.raises(ValueError):
+        make_point_rotator(45, page)
+
+
+@pytest.mark.parametrize("rotation", [90.5, 89.999])
+def test_non_integral_rotation_is_rejected(rotation: float):
+    page = Rect(0.0, 0.0, 595.0, 842.0)
+    with pytest.raises(ValueError):
+        rotate_rect(Rect(10.0, 20.0, 110.0, 70.0), page, rotation)
+    with pytest.raises(ValueError):
+        make_rotator(rotation, page)
+    with pytest.raises(ValueError):
+        map_bboxes_to_pdf(np.zeros((1, 4)), baseline_ratio=0.2, font_scale=1.0, config=_config(rotation))
+
+
+def test_map_bboxes_to_pdf_clamps_zero_area_boxes():
+    batch = map_bboxes_to_pdf(np.array([[10.0, 20.0, 0.0, 0.0]]), baseline_ratio=0.2, font_scale=1.0, config=_config(0))
+    assert batch["width_pt"].tolist() == [0.1]
+    assert batch["height_pt"].tolist() == [0.1]
+    assert batch["font_size"].tolist() == [2.0]
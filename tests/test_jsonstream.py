@@ -0,0 +1,19 @@
+import json
+
+import pytest
+
+from pdf_text_overlay.jsonstream import array_end, array_item
+
+
+@pytest.mark.parametrize("items", [[], [{"text": "a\nb", "box": [1, 2]}], [{"k": []}, "two", {"nested": {"x": 1}}]])
+def test_streamed_array_matches_json_dumps(items):
+    streamed = "[" + "".join(
+        array_item(json.dumps(item, indent=2), 1, first=position == 0) for position, item in enumerate(items)
+    ) + array_end(len(items), 1)
+    assert streamed == json.dumps(items, indent=2)
+
+    prelude = json.dumps({"pages": []}, indent=2)
+    nested = prelude[: prelude.rindex("[]")] + "[" + "".join(
+        array_item(json.dumps(item, indent=2), 2, first=position == 0) for position, item in enumerate(items)
+    ) + array_end(len(items), 2) + "\n}"
+    assert nested == json.dumps({"pages": items}, indent=2)
@@ -0,0 +1,100 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pdf_text_overlay.ocr_io import OCRPage, OCRWord, _lines_from_words, load_ocr_json
+
+
+def test_ocr_page_builds_word_columns():
+    page = OCRPage(
+        index=0,
+        width_px=100,
+        height_px=100,
+        rotation=None,
+        words=[OCRWord(text="a", bbox=(1, 2, 3, 4)), OCRWord(text="b", bbox=(5, 6, 7, 8))],
+    )
+    assert page.word_texts == ["a", "b"]
+    assert page.word_bboxes.dtype == np.float64
+    assert page.word_bboxes.tolist() == [[1, 2, 3, 4], [5, 6, 7, 8]]
+
+
+
+def test_ocr_page_word_columns_follow_words():
+    page = OCRPage(index=0, width_px=100, height_px=100, rotation=None, words=[OCRWord(text="a", bbox=(1, 2, 3, 4))])
+    page.words.append(OCRWord(text="b", bbox=(5, 6, 7, 8)))
+    assert page.word_texts == ["a", "b"]
+    assert page.word_bboxes.tolist() == [[1, 2, 3, 4], [5, 6, 7, 8]]
+    page.words[0].text = "c"
+    page.words[0].bbox = (9, 9, 9, 9)
+    assert page.word_texts == ["c", "b"]
+    assert page.word_bboxes.tolist() == [[9, 9, 9, 9], [5, 6, 7, 8]]
+    page.words = []
+    assert page.word_texts == []
+    assert page.word_bboxes.shape == (0, 4)
+
+
+def test_load_ocr_json_populates_word_columns(tmp_path: Path):
+    payload = [{"page": 0, "width_px": 100, "height_px": 200, "words": [{"text": "hi", "bbox": [0, 0, 20, 10]}]}]
+    file_path = tmp_path / "ocr.json"
+    file_path.write_text(json.dumps(payload), encoding="utf-8")
+    (page,) = load_ocr_json(file_path)
+    assert page.word_texts == ["hi"]
+    assert page.word_bboxes.shape == (1, 4)
+    assert page.lines[0].text == "hi"
+
+
+def test_iter_ocr_json_streams_large_files(tmp_path: Path, monkeypatch):
+    from pdf_text_overlay import ocr_io
+
+    payload = [{"page": i, "width_px": 10, "height_px": 10, "words": [{"text": "w", "bbox": [0, 0, 1, 1]}]} for i in range(3)]
+    file_path = tmp_path / "ocr.json"
+    file_path.write_text(json.dumps(payload), encoding="utf-8")
+    small = [page.index for page in ocr_io.iter_ocr_json(file_path)]
+    monkeypatch.setattr(ocr_io, "STREAM_THRESHOLD_BYTES", 0)
+    streamed = [page.index for page in ocr_io.iter_ocr_json(file_path)]
+    assert small == streamed == [0, 1, 2]
+
+
+def test_lines_from_words_groups_by_anchor_row():
+    words = [
+        OCRWord(text="world", bbox=(50, 11, 30, 10)),
+        OCRWord(text="hello", bbox=(10, 10, 30, 12)),
+        OCRWord(text="next", bbox=(10, 40, 20, 10)),
+    ]
+    lines = _lines_from_words(words)
+    assert [line.text for line in lines] == ["hello world", "next"]
+    assert lines[0].bbox == (10, 10, 70, 12)
+    assert lines[1].words == [words[2]]
+
+
+def test_save_ocr_json_round_trips_coordinates(tmp_path: Path):
+    from pdf_text_overlay.ocr_io import save_ocr_json
+
+    bbox = (100.1, 100.2, 30.3, 12.7)
+    page = OCRPage(index=0, width_px=200, height_px=300, rotation=None, words=[OCRWord(text="x", bbox=bbox)])
+    page.lines = _lines_from_words(page.words)
+    file_path = tmp_path / "ocr.json"
+    save_ocr_json([page], file_path)
+    payload = json.loads(file_path.read_text(encoding="utf-8"))
+    assert payload[0]["words"][0]["bbox"] == list(bbox)
+    assert payload[0]["lines"][0]["bbox"] == list(bbox)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_ocr_json_round_trips_non_finite_values(tmp_path: Path, monkeypatch, use_orjson: bool):
+    from pdf_text_overlay import ocr_io
+
+    if use_orjson and ocr_io.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(ocr_io, "orjson", None)
+    words = [OCRWord(text="x", bbox=(1.5, float("nan"), float("inf"), 4.0)), OCRWord(text="y", bbox=(np.float64(2.5), 3, 4, 5))]
+    page = OCRPage(index=0, width_px=200, height_px=300, rotation=None, words=words)
+    page.lines = _lines_from_words(page.words)
+    file_path = tmp_path / "ocr.json"
+    ocr_io.save_ocr_json([page], file_path)
+
+    (loaded,) = load_ocr_json(file_path)
+    np.testing.assert_array_equal(loaded.word_bboxes, page.word_bboxes)
@@ -0,0 +1,117 @@
+from pathlib import Path
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from pdf_text_overlay.ocr_io import OCRPage, OCRWord
+from pdf_text_overlay.overlay import OverlaySettings, apply_text_overlay
+
+
+@pytest.fixture
+def unicode_font(tmp_path: Path) -> Path:
+    # MuPDF's built-in fallback font covers Greek and the fraction slash.
+    path = tmp_path / "fallback.ttf"
+    path.write_bytes(fitz.Font("cjk").buffer)
+    return path
+
+
+def _blank_pdf(path: Path, pages: int = 1, rotation: int = 0) -> Path:
+    doc = fitz.open()
+    for _ in range(pages):
+        page = doc.new_page(width=300, height=300)
+        page.set_rotation(rotation)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.mark.parametrize("rotation", [0, 90])
+def test_font_choice_uses_normalized_text(tmp_path: Path, unicode_font: Path, rotation: int):
+    # "µ½" is Latin-1, but NFKC turns it into "μ1⁄2", which Helvetica cannot encode.
+    base_pdf = _blank_pdf(tmp_path / "base.pdf", rotation=rotation)
+    ocr_page = OCRPage(
+        index=0,
+        width_px=100,
+        height_px=100,
+        rotation=None,
+        words=[OCRWord(text="µ½", bbox=(20, 45, 40, 10))],
+    )
+    out_pdf = tmp_path / "out.pdf"
+    apply_text_overlay(base_pdf, [ocr_page], out_pdf, OverlaySettings(font_path=unicode_font))
+
+    with fitz.open(out_pdf) as result:
+        assert "μ1⁄2" in result[0].get_text()
+
+
+def _featureful_pdf(path: Path) -> Path:
+    doc = fitz.open()
+    for number, rotation in enumerate([0, 90, 180, 270, 0, 90]):
+        page = doc.new_page(width=300, height=400)
+        if number == 4:
+            page.set_cropbox(fitz.Rect(20, 30, 280, 380))
+        page.set_rotation(rotation)
+    doc[0].insert_link({"kind": fitz.LINK_GOTO, "from": fitz.Rect(10, 10, 50, 30), "page": 5, "to": fitz.Point(0, 0)})
+    doc.set_page_labels([{"startpage": 0, "prefix": "A-", "style": "D", "firstpagenum": 1}])
+    doc.embfile_add("note.txt", b"attached")
+    widget = fitz.Widget()
+    widget.field_name = "name"
+    widget.field_type = fitz.PDF_WIDGET_TYPE_TEXT
+    widget.rect = fitz.Rect(100, 300, 200, 320)
+    doc[2].add_widget(widget)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def _page_summary(page: "fitz.Page"):
+    words = [tuple(round(value, 2) for value in word[:4]) + (word[4],) for word in page.get_text("words")]
+    fonts = sorted({font[3].split("+")[-1] for font in page.get_fonts(full=True)})
+    return words, fonts
+
+
+def test_parallel_overlay_matches_serial(tmp_path: Path, unicode_font: Path):
+    base_pdf = _featureful_pdf(tmp_path / "base.pdf")
+    texts = ["alpha", "beta", "gamma", "Ωmega", "epsilon", "zeta"]
+    ocr_pages = [
+        OCRPage(index=index, width_px=300, height_px=400, rotation=None, words=[OCRWord(text=text, bbox=(40, 60, 80, 12))])
+        for index, text in enumerate(texts)
+    ]
+
+    results = {}
+    for jobs in (1, 3):
+        out_pdf = tmp_path / f"out_{jobs}.pdf"
+        settings = OverlaySettings(font_path=unicode_font, jobs=jobs)
+        apply_text_overlay(base_pdf, list(ocr_pages), out_pdf, settings)
+        with fitz.open(out_pdf) as result:
+            results[jobs] = {
+                "pages": [_page_summary(page) for page in result],
+                "links": [link["page"] for link in result[0].get_links()],
+                "labels": result.get_page_labels(),
+                "files": result.embfile_names(),
+                "fields": [widget.field_name for page in result for widget in page.widgets()],
+            }
+
+    serial, parallel = results[1], results[3]
+    assert parallel == serial
+    assert [page[0][0][4] for page in serial["pages"]] == texts
+    # Helvetica up to the first non-Latin page, the font file from there on.
+    assert [page[1] for page in serial["pages"]][2:4] == [["Helvetica"], [fitz.Font("cjk").name]]
+    assert serial["links"] == [5]
+    assert serial["files"] == ["note.txt"]
+    assert serial["fields"] == ["name"]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_repeated_page_index_keeps_last_entry(tmp_path: Path, jobs: int):
+    base_pdf = _blank_pdf(tmp_path / "base.pdf", pages=4)
+    ocr_pages = [
+        OCRPage(index=index, width_px=300, height_px=300, rotation=None, words=[OCRWord(text=text, bbox=(40, 60, 80, 12))])
+        for index, text in [(0, "stale"), (1, "other"), (0, "fresh")]
+    ]
+    out_pdf = tmp_path / "out.pdf"
+    apply_text_overlay(base_pdf, iter(ocr_pages), out_pdf, OverlaySettings(jobs=jobs))
+
+    with fitz.open(out_pdf) as result:
+        assert [word[4] for word in result[0].get_text("words")] == ["fresh"]
+        assert [word[4] for word in result[1].get_text("words")] == ["other"]
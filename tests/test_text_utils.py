@@ -0,0 +1,34 @@
+from pdf_text_overlay.text_utils import dehyphenize, dehyphenize_spans, is_cjk, normalize_token
+
+
+def test_normalize_token_strips_zero_width_characters():
+    assert normalize_token(" A​B‌﻿ \n C ") == "A B C"
+    assert normalize_token("a‍b", keep_spaces=True) == "ab"
+
+
+def test_normalize_token_ascii_fast_path_matches_full_normalization():
+    assert normalize_token("plain") == "plain"
+    assert normalize_token(" a  b\tc\x1f") == "a b c"
+    assert normalize_token(" a  b ", keep_spaces=True) == " a  b "
+    assert normalize_token("") == ""
+
+
+def test_normalize_token_joins_cjk():
+    assert normalize_token("一 丁 a", cjk_join=True) == "一丁 a"
+
+
+def test_dehyphenize_joins_lowercase_continuation():
+    assert dehyphenize(["exam-", "ple", "Next"]) == ["example", "Next"]
+
+
+def test_dehyphenize_spans_maps_outputs_to_first_input_line():
+    assert dehyphenize_spans(["exam-", "ple", "", "Next"]) == (["example", "", "Next"], [0, 2, 3])
+
+
+def test_normalize_token_cjk_join_keeps_edge_whitespace():
+    assert normalize_token(" 一 丁 ", keep_spaces=True, cjk_join=True) == " 一丁 "
+
+
+def test_is_cjk_range_edges():
+    assert [is_cjk(c) for c in "\u4e00\u9fff\u3400\uf900\U00020000\U0002ceaf"] == [True] * 6
+    assert [is_cjk(c) for c in "a\u4dc0\ufb00\U0002ceb0\u3000"] == [False] * 5
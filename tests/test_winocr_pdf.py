@@ -0,0 +1,246 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+import winocr_pdf
+from winocr_pdf import (
+    OCRToolError,
+    OutputWriter,
+    PageOCR,
+    build_layout_payload,
+    build_markdown_output,
+    build_text_output,
+    extract_line_data,
+    parse_args,
+    resolve_inputs,
+    resolve_paths,
+)
+
+
+class _Rect:
+    def __init__(self, x: float) -> None:
+        self.x, self.y, self.width, self.height = x, 3.5, 10.25, 5.0
+
+
+class _Word:
+    def __init__(self, text: str, position: int) -> None:
+        self.text = text
+        self.bounding_rect = _Rect(position * 12.0)
+
+
+class _Line:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.words = [_Word(part, position) for position, part in enumerate(text.split())]
+
+
+class _Result:
+    def __init__(self, *lines: str) -> None:
+        self.lines = [_Line(line) for line in lines]
+        self.text = "\r\n".join(lines)
+
+
+class _Engine:
+    """Fake OcrEngine: later pages finish first, and ``fail_on`` raises for one page."""
+
+    def __init__(self, page_count: int, fail_on: int = -1) -> None:
+        self.page_count = page_count
+        self.fail_on = fail_on
+        self.started = []
+
+    async def recognize_async(self, page):
+        index = len(self.started)
+        self.started.append(index)
+        await asyncio.sleep(0.002 * (self.page_count - index))
+        if index == self.fail_on:
+            raise RuntimeError(f"OCR failed on page {index}")
+        return _Result(f"page {index} wide {page.width}", "")
+
+
+def _page(index: int, *lines: str) -> PageOCR:
+    plain_text, line_texts, word_texts, word_bboxes = extract_line_data(_Result(*lines))
+    return PageOCR(
+        index=index,
+        width=100 + index,
+        height=200,
+        line_texts=line_texts,
+        word_texts=word_texts,
+        word_bboxes=word_bboxes,
+        plain_text=plain_text,
+    )
+
+
+def _pdf(path: Path, pages: int, text_pages=()) -> Path:
+    doc = fitz.open()
+    for number in range(pages):
+        page = doc.new_page(width=200, height=300)
+        if number in text_pages:
+            page.insert_text((20, 50), f"Embedded text on page {number}")
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def test_extract_line_data_builds_columns():
+    plain_text, line_texts, word_texts, word_bboxes = extract_line_data(_Result("alpha beta", "gamma"))
+    assert plain_text == "alpha beta\ngamma"
+    assert line_texts == ["alpha beta", "gamma"]
+    assert word_texts == [["alpha", "beta"], ["gamma"]]
+    assert word_bboxes.tolist() == [[0.0, 3.5, 10.25, 5.0], [12.0, 3.5, 10.25, 5.0], [0.0, 3.5, 10.25, 5.0]]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@pytest.mark.parametrize("page_count", [0, 1, 3])
+def test_output_writer_matches_batch_builders(tmp_path: Path, monkeypatch, use_orjson: bool, page_count: int):
+    if use_orjson and winocr_pdf.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(winocr_pdf, "orjson", None)
+    pages = [_page(index, f"line {index} «ü»", "second  line  ", "") for index in range(page_count)]
+    if pages:
+        pages[0] = _page(0)  # a page with no recognized text
+    pdf_path = tmp_path / "doc.pdf"
+
+    writer = OutputWriter(pdf_path, tmp_path, None, "both", dump_pages=True)
+    writer.start("ko-KR")
+    for page in pages:
+        writer.write_page(page)
+    writer.close()
+
+    assert (tmp_path / "doc.txt").read_text(encoding="utf-8") == build_text_output(pages)
+    assert (tmp_path / "doc.md").read_text(encoding="utf-8") == build_markdown_output(pages)
+    expected_layout = json.dumps(build_layout_payload(pages, None, pdf_path, "ko-KR"), ensure_ascii=False, indent=2)
+    assert (tmp_path / "doc_layout.json").read_text(encoding="utf-8") == expected_layout
+    assert not list(tmp_path.glob("*.part"))
+
+
+def test_output_writer_abort_leaves_no_files(tmp_path: Path):
+    writer = OutputWriter(tmp_path / "doc.pdf", tmp_path, 200, "both", dump_pages=True)
+    writer.start(None)
+    writer.write_page(_page(0, "text"))
+    writer.abort()
+    assert list(tmp_path.iterdir()) == []
+
+
+def _run_pipeline(tmp_path: Path, page_count: int, engine: _Engine, **options):
+    doc = fitz.open(_pdf(tmp_path / "doc.pdf", page_count, options.pop("text_pages", ())))
+    try:
+        driver = winocr_pdf._process_pdf_async(
+            doc,
+            page_count,
+            engine,
+            72,
+            3,
+            tmp_path / "doc.pdf",
+            tmp_path,
+            False,
+            False,
+            **options,
+        )
+        return asyncio.run(asyncio.wait_for(driver, timeout=10))
+    finally:
+        doc.close()
+
+
+@pytest.fixture
+def raw_bitmaps(monkeypatch):
+    async def to_bitmap(page):
+        return page
+
+    monkeypatch.setattr(winocr_pdf, "_page_to_software_bitmap", to_bitmap)
+
+
+def test_process_pdf_async_delivers_pages_in_order(tmp_path: Path, raw_bitmaps):
+    delivered = []
+
+    class Output:
+        write_page = delivered.append
+
+    pages = _run_pipeline(tmp_path, 6, _Engine(6))
+    assert [page.index for page in pages] == list(range(6))
+    assert pages[0].plain_text == "page 0 wide 200"
+
+    assert _run_pipeline(tmp_path, 6, _Engine(6), output=Output()) == []
+    assert [page.index for page in delivered] == list(range(6))
+
+
+def test_process_pdf_async_cancels_remaining_pages_on_failure(tmp_path: Path, raw_bitmaps):
+    engine = _Engine(12, fail_on=1)
+    with pytest.raises(RuntimeError, match="page 1"):
+        _run_pipeline(tmp_path, 12, engine)
+    # The bounded queue stops rendering ahead, so most pages never reach the engine.
+    assert len(engine.started) < 12
+
+
+def test_process_pdf_async_skips_text_pages_in_order(tmp_path: Path, raw_bitmaps):
+    engine = _Engine(5)
+    pages = _run_pipeline(tmp_path, 5, engine, text_pages=(0, 3), skip_text_chars=10)
+    assert [page.index for page in pages] == list(range(5))
+    assert pages[0].plain_text == "Embedded text on page 0"
+    assert pages[3].plain_text == "Embedded text on page 3"
+    assert pages[3].line_texts == [] and pages[3].word_bboxes.shape == (0, 4)
+    assert (pages[3].width, pages[3].height) == (pages[1].width, pages[1].height)
+    assert len(engine.started) == 3
+
+
+def test_resolve_inputs_accepts_file_directory_and_glob(tmp_path: Path):
+    first = _pdf(tmp_path / "b.pdf", 1)
+    second = _pdf(tmp_path / "a.PDF", 1)
+    (tmp_path / "notes.txt").write_text("x")
+
+    assert resolve_inputs(str(first)) == [first]
+    assert resolve_inputs(str(tmp_path)) == [second, first]
+    assert resolve_inputs(str(tmp_path / "*.pdf")) == [first]
+    # Glob matches get the same .pdf filter as directory inputs.
+    assert resolve_inputs(str(tmp_path / "*")) == [second, first]
+    with pytest.raises(OCRToolError, match="No PDF files match"):
+        resolve_inputs(str(tmp_path / "zz*.pdf"))
+    with pytest.raises(OCRToolError, match="No PDF files match"):
+        resolve_inputs(str(tmp_path / "*.txt"))
+    with pytest.raises(OCRToolError, match="not found"):
+        resolve_inputs(str(tmp_path / "missing.pdf"))
+    empty = tmp_path / "empty"
+    empty.mkdir()
+    with pytest.raises(OCRToolError, match="No PDF files"):
+        resolve_inputs(str(empty))
+
+
+def test_resolve_paths_rejects_duplicate_stems(tmp_path: Path):
+    for folder in ("one", "two"):
+        (tmp_path / folder).mkdir()
+        _pdf(tmp_path / folder / "scan.pdf", 1)
+    with pytest.raises(OCRToolError, match="same output files"):
+        resolve_paths(str(tmp_path / "*" / "scan.pdf"), str(tmp_path / "out"), create_output_dir=False)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--jobs", "0"],
+        ["--concurrency", "0"],
+        ["--dpi", "0"],
+        ["--skip-text-pages", "0"],
+    ],
+)
+def test_parse_args_rejects_non_positive_values(argv):
+    with pytest.raises(SystemExit) as excinfo:
+        parse_args(["-i", "doc.pdf", *argv])
+    assert excinfo.value.code == 2
+
+
+def test_parse_args_skip_text_pages_default_threshold():
+    assert parse_args(["-i", "doc.pdf"]).skip_text_pages is None
+    assert parse_args(["-i", "doc.pdf", "--skip-text-pages"]).skip_text_pages == winocr_pdf.MIN_EMBEDDED_CHARS
+    assert parse_args(["-i", "doc.pdf", "--skip-text-pages", "5"]).skip_text_pages == 5
+
+
+def test_parse_args_png_fast_requires_pillow(monkeypatch):
+    assert parse_args(["-i", "doc.pdf", "--png-fast"]).png_fast
+    monkeypatch.setattr(winocr_pdf, "Image", None)
+    with pytest.raises(SystemExit) as excinfo:
+        parse_args(["-i", "doc.pdf", "--png-fast"])
+    assert excinfo.value.code == 2
@@ -6,6 +6,8 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
+import glob
 import importlib
 import json
 import logging
@@ -14,10 +16,14 @@ import platform
 import struct
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from io import BytesIO
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Awaitable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from pdf_text_overlay.jsonstream import array_end, array_item
 
 try:
     import fitz  # type: ignore
@@ -29,11 +35,13 @@ else:
 
 try:
     from PIL import Image
-except ImportError as exc:  # pragma: no cover - import guard
+except ImportError:  # pragma: no cover - optional dependency
     Image = None  # type: ignore
-    PIL_IMPORT_ERROR = exc
-else:
-    PIL_IMPORT_ERROR = None
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
     from winrt.windows.graphics.imaging import SoftwareBitmap  # type: ignore
@@ -56,23 +64,41 @@ class OCRToolError(Exception):
 
 @dataclass
 class PageOCR:
-    """Structured OCR output for a single page."""
+    """Structured OCR output for a single page.
+
+    Word boxes for the whole page live in one ``(n_words, 4)`` float32 array of pixel
+    ``x, y, width, height`` rows, in reading order; ``word_texts[i]`` lists line ``i``'s words.
+    """
 
     index: int
     width: int
     height: int
-    lines: List[Dict[str, Any]]
+    line_texts: List[str]
+    word_texts: List[List[str]]
+    word_bboxes: np.ndarray
     plain_text: str
 
 
+@dataclass
+class RenderedPage:
+    """8-bit grayscale page pixels, viewed in place inside the pixmap that holds them."""
+
+    width: int
+    height: int
+    stride: int
+    buffer: memoryview
+    # Owns the memory behind ``buffer``; the view is only valid while the pixmap is alive.
+    pixmap: "fitz.Pixmap"
+
+
 OcrEngine: Any = None
 Language: Any = None
-InMemoryRandomAccessStream: Any = None
 DataWriter: Any = None
-BitmapDecoder: Any = None
 SoftwareBitmap_cls: Any = None
 BitmapPixelFormat: Any = None
 BitmapAlphaMode: Any = None
+# BitmapPixelFormat.GRAY8, resolved once by _ensure_winrt() for the per-page path.
+_GRAY8: Any = None
 
 _WINRT_READY = False
 _WINRT_MODULES: Tuple[Tuple[str, str], ...] = (
@@ -115,7 +141,16 @@ _FORMAT_ALIASES = {
 }
 
 
-T = TypeVar("T")
+# Default number of pages rendered and recognized at once.
+OCR_CONCURRENCY = os.cpu_count() or 1
+# Default number of worker processes when -i names several PDFs; each runs its own engine.
+PDF_WORKERS = max(1, (os.cpu_count() or 1) // 2)
+# Windows OCR accuracy on printed text levels off well below 300 DPI.
+DEFAULT_DPI = 200
+# With --auto-dpi, each page is scaled so its shorter side renders to this many pixels.
+AUTO_DPI_MIN_PIXELS = 1600
+# With --skip-text-pages, pages whose embedded text has at least this many characters skip OCR.
+MIN_EMBEDDED_CHARS = 40
 
 
 def _ensure_winrt() -> None:
@@ -123,8 +158,8 @@ def _ensure_winrt() -> None:
 
     global _WINRT_READY
     global OcrEngine, Language
-    global InMemoryRandomAccessStream, DataWriter
-    global BitmapDecoder, SoftwareBitmap_cls, BitmapPixelFormat, BitmapAlphaMode
+    global DataWriter
+    global SoftwareBitmap_cls, BitmapPixelFormat, BitmapAlphaMode, _GRAY8
     global WinRTOcrResult
 
     if _WINRT_READY:
@@ -162,12 +197,11 @@ def _ensure_winrt() -> None:
     OcrEngine = media_ocr.OcrEngine
     WinRTOcrResult = media_ocr.OcrResult
     Language = globalization.Language
-    InMemoryRandomAccessStream = streams.InMemoryRandomAccessStream
     DataWriter = streams.DataWriter
-    BitmapDecoder = imaging.BitmapDecoder
     SoftwareBitmap_cls = imaging.SoftwareBitmap
     BitmapPixelFormat = imaging.BitmapPixelFormat
     BitmapAlphaMode = imaging.BitmapAlphaMode
+    _GRAY8 = BitmapPixelFormat.GRAY8
 
     _WINRT_READY = True
 
@@ -200,7 +234,7 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         "-i",
         "--input",
         required=True,
-        help="Path to input PDF file (absolute or relative).",
+        help="Input PDF file, a directory of PDFs, or a glob pattern (e.g. \"scans\\*.pdf\").",
     )
     parser.add_argument(
         "-o",
@@ -211,8 +245,16 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser.add_argument(
         "--dpi",
         type=int,
-        default=300,
-        help="Rendering DPI for PDF pages (default: 300).",
+        default=DEFAULT_DPI,
+        help=f"Rendering DPI for PDF pages (default: {DEFAULT_DPI}).",
+    )
+    parser.add_argument(
+        "--auto-dpi",
+        action="store_true",
+        help=(
+            f"Pick the DPI per page so its shorter side renders to {AUTO_DPI_MIN_PIXELS} px "
+            "(overrides --dpi; layout JSON then records dpi as null)."
+        ),
     )
     parser.add_argument(
         "--lang",
@@ -231,6 +273,30 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         default=None,
         help="Limit the number of pages to process (default: all).",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=OCR_CONCURRENCY,
+        help=f"Pages recognized at once; up to twice as many rendered pages are queued (default: {OCR_CONCURRENCY}).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=PDF_WORKERS,
+        help=f"PDFs processed at once, one worker process each, when -i matches several (default: {PDF_WORKERS}).",
+    )
+    parser.add_argument(
+        "--skip-text-pages",
+        type=int,
+        nargs="?",
+        const=MIN_EMBEDDED_CHARS,
+        default=None,
+        metavar="MIN_CHARS",
+        help=(
+            "Use the embedded text of pages that already have at least MIN_CHARS characters of it "
+            f"instead of running OCR (default MIN_CHARS: {MIN_EMBEDDED_CHARS})."
+        ),
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -241,6 +307,11 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Dump rendered page images (.png) and layout JSON alongside results.",
     )
+    parser.add_argument(
+        "--png-fast",
+        action="store_true",
+        help="Write --dump-pages images with Pillow at zlib level 1: faster, about 20%% larger files.",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -253,6 +324,14 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         parser.error("--dpi must be a positive integer.")
     if args.max_pages is not None and args.max_pages <= 0:
         parser.error("--max-pages must be a positive integer when provided.")
+    if args.concurrency <= 0:
+        parser.error("--concurrency must be a positive integer.")
+    if args.jobs <= 0:
+        parser.error("--jobs must be a positive integer.")
+    if args.skip_text_pages is not None and args.skip_text_pages <= 0:
+        parser.error("--skip-text-pages must be a positive integer when given a value.")
+    if args.png_fast and Image is None:
+        parser.error("--png-fast requires Pillow. Install with 'pip install pillow'.")
     return args
 
 
@@ -288,30 +367,52 @@ def ensure_environment() -> None:
             "Missing dependency: PyMuPDF (pymupdf). Install with 'pip install pymupdf'.",
             exit_code=2,
         )
-    if PIL_IMPORT_ERROR is not None:
-        raise OCRToolError(
-            "Missing dependency: Pillow. Install with 'pip install pillow'.",
-            exit_code=2,
-        )
 
     _ensure_winrt()
 
 
-def resolve_paths(input_path: str, outdir: str, create_output_dir: bool) -> Tuple[Path, Path]:
+def resolve_inputs(input_path: str) -> List[Path]:
+    """Expand ``-i`` into PDF paths: a single file, every PDF in a directory, or a glob pattern."""
+
+    path = Path(input_path).expanduser()
+    if path.is_file():
+        return [path]
+    if path.is_dir():
+        pdf_paths = sorted(entry for entry in path.iterdir() if entry.is_file() and entry.suffix.lower() == ".pdf")
+        if not pdf_paths:
+            raise OCRToolError(f"No PDF files found in {path}.", exit_code=2)
+        return pdf_paths
+    if any(char in input_path for char in "*?["):
+        matches = (Path(match) for match in glob.glob(str(path), recursive=True))
+        pdf_paths = sorted(match for match in matches if match.is_file() and match.suffix.lower() == ".pdf")
+        if not pdf_paths:
+            raise OCRToolError(f"No PDF files match {input_path}.", exit_code=2)
+        return pdf_paths
+    raise OCRToolError(
+        f"Input PDF not found: {path}. Verify the path and ensure the file exists.",
+        exit_code=2,
+    )
+
+
+def resolve_paths(input_path: str, outdir: str, create_output_dir: bool) -> Tuple[List[Path], Path]:
     """Resolve filesystem paths with Windows-friendly handling."""
 
-    pdf_path = Path(input_path).expanduser()
-    if not pdf_path.is_file():
-        raise OCRToolError(
-            f"Input PDF not found: {pdf_path}. Verify the path and ensure the file exists.",
-            exit_code=2,
-        )
+    pdf_paths = resolve_inputs(input_path)
+    # Outputs are named after the input stem, so two inputs must not share one.
+    seen: Dict[str, Path] = {}
+    for pdf_path in pdf_paths:
+        other = seen.setdefault(pdf_path.stem.lower(), pdf_path)
+        if other is not pdf_path:
+            raise OCRToolError(
+                f"Inputs {other} and {pdf_path} would write the same output files.",
+                exit_code=2,
+            )
     output_dir = Path(outdir).expanduser()
     if create_output_dir:
         output_dir.mkdir(parents=True, exist_ok=True)
     elif not output_dir.exists():
         logger.warning("Output directory %s does not exist (dry-run mode).", output_dir)
-    return pdf_path, output_dir
+    return pdf_paths, output_dir
 
 
 def _normalize_language_tag(language_code: str) -> str:
@@ -325,8 +426,13 @@ def _normalize_language_tag(language_code: str) -> str:
     return canonical.lower()
 
 
+@functools.lru_cache(maxsize=8)
 def create_ocr_engine(language_code: str) -> Tuple[Any, Optional[str], bool]:
-    """Initialize the Windows OCR engine with language fallback."""
+    """Initialize the Windows OCR engine with language fallback.
+
+    Engines are cached per ``language_code``, so processing several PDFs in one process
+    builds each engine (and its language lookup) once. Failures are not cached.
+    """
 
     _ensure_winrt()
 
@@ -378,160 +484,343 @@ def create_ocr_engine(language_code: str) -> Tuple[Any, Optional[str], bool]:
     )
 
 
-async def _pil_image_to_software_bitmap(image: Image.Image) -> SoftwareBitmap:
-    """Convert a PIL Image into a SoftwareBitmap suitable for WinRT OCR."""
+async def _page_to_software_bitmap(page: RenderedPage) -> SoftwareBitmap:
+    """Copy a rendered page into a SoftwareBitmap suitable for WinRT OCR.
 
-    _ensure_winrt()
+    WinRT must already be loaded; ``create_ocr_engine`` does that before any page is processed.
+    """
 
-    buffer = BytesIO()
-    image.save(buffer, format="PNG")
-    data = buffer.getvalue()
-    logger.debug("Saved PIL image to PNG buffer (%d bytes).", len(data))
-
-    stream = InMemoryRandomAccessStream()
-    writer = DataWriter(stream)
-    writer.write_bytes(data)
-    await writer.store_async()
-    await writer.flush_async()
-    writer.detach_stream()
-    writer.close()
-    stream.seek(0)
-
-    decoder = await BitmapDecoder.create_async(stream)
-    sbmp = await decoder.get_software_bitmap_async()
-    logger.debug(
-        "Decoded SoftwareBitmap: %dx%d px, format=%s",
-        sbmp.pixel_width,
-        sbmp.pixel_height,
-        sbmp.bitmap_pixel_format,
+    writer = DataWriter()
+    # Pages are rendered as 8-bit grayscale, the format the OCR engine consumes, so the
+    # pixmap's samples are handed over as-is: no intermediate image and no convert pass.
+    writer.write_bytes(page.buffer)
+    sbmp = SoftwareBitmap_cls.create_copy_from_buffer(
+        writer.detach_buffer(),
+        _GRAY8,
+        page.width,
+        page.height,
     )
-    if sbmp.bitmap_pixel_format != BitmapPixelFormat.GRAY8:
-        logger.debug("Converting SoftwareBitmap to GRAY8 format for OCR compatibility.")
-        try:
-            sbmp = SoftwareBitmap_cls.convert(sbmp, BitmapPixelFormat.GRAY8, BitmapAlphaMode.IGNORE)
-        except TypeError:
-            sbmp = SoftwareBitmap_cls.convert(sbmp, BitmapPixelFormat.GRAY8)
+    if logger.isEnabledFor(logging.DEBUG):
+        # Each property read crosses the WinRT boundary; skip them unless logging.
+        logger.debug(
+            "Copied page pixels into SoftwareBitmap: %dx%d px, format=%s",
+            sbmp.pixel_width,
+            sbmp.pixel_height,
+            sbmp.bitmap_pixel_format,
+        )
     return sbmp
 
 
-async def _recognize_page_async(engine: Any, image: Image.Image) -> WinRTOcrResult:
-    """Run WinRT OCR on a PIL image."""
-
-    sbmp = await _pil_image_to_software_bitmap(image)
-    try:
-        result = await engine.recognize_async(sbmp)
-        return result
-    except Exception as exc:
-        logger.debug(
-            "Initial OCR attempt failed (%s); retrying after GRAY8 conversion fallback.",
-            exc,
-        )
-        sbmp_gray = SoftwareBitmap_cls.convert(sbmp, BitmapPixelFormat.GRAY8)
-        result = await engine.recognize_async(sbmp_gray)
-        return result
+async def _recognize_page_async(engine: Any, page: RenderedPage) -> WinRTOcrResult:
+    """Run WinRT OCR on a rendered page."""
 
+    # The bitmap is always built as GRAY8, which OcrEngine accepts as-is; a failure here
+    # is not a pixel-format problem, so it propagates instead of being retried.
+    sbmp = await _page_to_software_bitmap(page)
+    return await engine.recognize_async(sbmp)
 
-def run_async(coro: Awaitable[T]) -> T:
-    """Run an async coroutine synchronously."""
 
-    return asyncio.run(coro)
+def _page_scale(page: "fitz.Page", dpi: Optional[int]) -> float:
+    """Return the render zoom for ``dpi``, or the smallest one meeting ``AUTO_DPI_MIN_PIXELS`` when ``None``."""
 
+    if dpi is not None:
+        return dpi / 72.0
+    rect = page.rect
+    shorter_side = min(rect.width, rect.height)
+    if shorter_side <= 0:
+        return DEFAULT_DPI / 72.0
+    return AUTO_DPI_MIN_PIXELS / shorter_side
 
-def render_page_to_image(page: "fitz.Page", dpi: int) -> Image.Image:
-    """Render a PDF page to a PIL image."""
 
-    assert Image is not None
+def render_page_to_image(page: "fitz.Page", dpi: Optional[int]) -> RenderedPage:
+    """Render a PDF page to 8-bit grayscale pixels (``dpi=None`` picks the DPI per page)."""
 
-    scale = dpi / 72.0
+    scale = _page_scale(page, dpi)
     matrix = fitz.Matrix(scale, scale)
-    pix = page.get_pixmap(matrix=matrix, alpha=False)
-    image = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+    # OCR only reads luminance; grayscale moves a third of the bytes RGB would.
+    pix = page.get_pixmap(matrix=matrix, colorspace=fitz.csGRAY, alpha=False)
+    rendered = RenderedPage(
+        width=pix.width,
+        height=pix.height,
+        stride=pix.stride,
+        buffer=pix.samples_mv,
+        pixmap=pix,
+    )
     logger.debug(
-        "Rendered page %d to image: %dx%d px, DPI=%d.",
+        "Rendered page %d to image: %dx%d px, DPI=%.0f.",
         page.number,
-        image.width,
-        image.height,
-        dpi,
+        rendered.width,
+        rendered.height,
+        scale * 72.0,
     )
-    return image
-
-
-def extract_line_data(ocr_result: WinRTOcrResult) -> Tuple[str, List[Dict[str, Any]]]:
-    """Convert an OCR result into plain text and structured line data."""
-
-    lines: List[Dict[str, Any]] = []
-    for line in ocr_result.lines:
-        words: List[Dict[str, Any]] = []
-        for word in line.words:
-            rect = word.bounding_rect
-            words.append(
-                {
-                    "text": word.text,
-                    "bbox": [rect.x, rect.y, rect.width, rect.height],
-                }
-            )
-        lines.append({"text": line.text, "words": words})
+    return rendered
+
+
+def _save_page_png(page: RenderedPage, path: Path, fast: bool = False) -> None:
+    """Write a rendered page as PNG with PyMuPDF's encoder, or Pillow at zlib level 1 when ``fast``.
+
+    Dumps run on the render thread, so a slow encoder delays the pages queued behind it.
+    """
+
+    if not fast:
+        page.pixmap.save(str(path))
+        return
+    # Wraps the pixmap's samples without copying; closed before the pixmap can be freed.
+    with Image.frombuffer("L", (page.width, page.height), page.buffer, "raw", "L", page.stride, 1) as image:
+        image.save(path, "PNG", compress_level=1, optimize=False)
+
+
+def extract_line_data(ocr_result: WinRTOcrResult) -> Tuple[str, List[str], List[List[str]], np.ndarray]:
+    """Convert an OCR result into plain text, line texts, per-line word texts and word boxes."""
+
+    # Every attribute read crosses into WinRT: each collection is walked once and each
+    # word's text and bounding_rect are fetched exactly once.
+    lines = [(line.text, list(line.words)) for line in ocr_result.lines]
+    line_texts = [text for text, _ in lines]
+    word_texts = [[word.text for word in words] for _, words in lines]
+    rects = [word.bounding_rect for _, words in lines for word in words]
+    # WinRT rects are single precision, so float32 holds them exactly in one allocation.
+    word_bboxes = np.fromiter(
+        (value for rect in rects for value in (rect.x, rect.y, rect.width, rect.height)),
+        dtype=np.float32,
+        count=4 * len(rects),
+    ).reshape(len(rects), 4)
     plain_text = ocr_result.text.replace("\r\n", "\n").rstrip()
-    return plain_text, lines
+    return plain_text, line_texts, word_texts, word_bboxes
+
+
+def _text_block(page: PageOCR) -> str:
+    return f"===== Page {page.index + 1} =====\n{page.plain_text or ''}"
+
+
+def _markdown_block(page: PageOCR) -> str:
+    content = page.plain_text.strip() if page.plain_text else "_No text recognized._"
+    return f"## Page {page.index + 1}\n\n{content}"
+
+
+def _layout_page(page: PageOCR) -> Dict[str, Any]:
+    # Boxes turn into Python lists only here, at serialization time.
+    bboxes = iter(page.word_bboxes.tolist())
+    return {
+        "index": page.index,
+        "width": page.width,
+        "height": page.height,
+        "lines": [
+            {"text": text, "words": [{"text": word, "bbox": next(bboxes)} for word in words]}
+            for text, words in zip(page.line_texts, page.word_texts)
+        ],
+    }
 
 
 def build_text_output(pages: Iterable[PageOCR]) -> str:
     """Build plain text output with page delimiters."""
 
-    parts: List[str] = []
-    for page in pages:
-        parts.append(f"===== Page {page.index + 1} =====")
-        parts.append(page.plain_text or "")
-    return "\n".join(parts).rstrip() + "\n"
+    return "\n".join(_text_block(page) for page in pages).rstrip() + "\n"
 
 
 def build_markdown_output(pages: Iterable[PageOCR]) -> str:
     """Build Markdown output with page headings."""
 
-    blocks: List[str] = []
-    for page in pages:
-        blocks.append(f"## Page {page.index + 1}")
-        content = page.plain_text.strip() if page.plain_text else "_No text recognized._"
-        blocks.append(content)
-    return "\n\n".join(blocks).rstrip() + "\n"
+    return "\n\n".join(_markdown_block(page) for page in pages).rstrip() + "\n"
 
 
-def build_layout_payload(pages: Iterable[PageOCR], dpi: int, input_file: Path, resolved_language: Optional[str]) -> Dict[str, Any]:
+def build_layout_payload(pages: Iterable[PageOCR], dpi: Optional[int], input_file: Path, resolved_language: Optional[str]) -> Dict[str, Any]:
     """Create JSON structure for OCR layout results."""
 
     return {
         "file": str(input_file),
         "dpi": dpi,
         "lang": resolved_language,
-        "pages": [
-            {
-                "index": page.index,
-                "width": page.width,
-                "height": page.height,
-                "lines": page.lines,
-            }
-            for page in pages
-        ],
+        "pages": [_layout_page(page) for page in pages],
     }
 
 
+async def _ocr_rendered_page(engine: Any, index: int, page: RenderedPage) -> PageOCR:
+    """Recognize one rendered page."""
+
+    page_start = time.perf_counter()
+    ocr_result = await _recognize_page_async(engine, page)
+    plain_text, line_texts, word_texts, word_bboxes = extract_line_data(ocr_result)
+    page_elapsed = time.perf_counter() - page_start
+    logger.info("Page %d recognized in %.2f seconds.", index + 1, page_elapsed)
+
+    return PageOCR(
+        index=index,
+        width=page.width,
+        height=page.height,
+        line_texts=line_texts,
+        word_texts=word_texts,
+        word_bboxes=word_bboxes,
+        plain_text=plain_text,
+    )
+
+
+def _embedded_text_page(page: "fitz.Page", index: int, dpi: Optional[int], min_chars: int) -> Optional[PageOCR]:
+    """Return the page's embedded text as a ``PageOCR`` when it has at least ``min_chars`` characters."""
+
+    raw = page.get_text("text")
+    if len(raw.strip()) < min_chars:
+        return None
+    scale = _page_scale(page, dpi)
+    # Same pixel size get_pixmap would have produced, so layout pages stay comparable.
+    size = (page.rect * fitz.Matrix(scale, scale)).irect
+    return PageOCR(
+        index=index,
+        width=size.width,
+        height=size.height,
+        line_texts=[],
+        word_texts=[],
+        word_bboxes=np.empty((0, 4), dtype=np.float32),
+        plain_text=raw.replace("\r\n", "\n").rstrip(),
+    )
+
+
+def _render_page_index(
+    doc: "fitz.Document",
+    index: int,
+    dpi: Optional[int],
+    dump_path: Optional[Path],
+    png_fast: bool,
+    skip_text_chars: Optional[int] = None,
+) -> Union[RenderedPage, PageOCR]:
+    """Render one page and, with ``dump_path``, write it as PNG while still on the render thread.
+
+    With ``skip_text_chars``, a page with enough embedded text comes back as a finished
+    ``PageOCR`` instead and is neither rendered nor dumped.
+    """
+
+    page = doc.load_page(index)
+    if skip_text_chars is not None:
+        text_page = _embedded_text_page(page, index, dpi, skip_text_chars)
+        if text_page is not None:
+            logger.info("Page %d has embedded text; skipping OCR.", index + 1)
+            return text_page
+    rendered = render_page_to_image(page, dpi)
+    if dump_path is not None:
+        _save_page_png(rendered, dump_path, png_fast)
+        logger.debug("Dumped rendered page to %s.", dump_path)
+    return rendered
+
+
+async def _process_pdf_async(
+    doc: "fitz.Document",
+    target_count: int,
+    engine: Any,
+    dpi: Optional[int],
+    concurrency: int,
+    pdf_path: Path,
+    output_dir: Path,
+    dump_pages: bool,
+    dry_run: bool,
+    output: Optional["OutputWriter"] = None,
+    png_fast: bool = False,
+    skip_text_chars: Optional[int] = None,
+) -> List[PageOCR]:
+    """Render pages ahead into a bounded queue while ``concurrency`` workers run OCR on them.
+
+    The queue holds at most ``2 * concurrency`` rendered pages, so memory stays bounded
+    however far rendering gets ahead of recognition. Finished pages are released in page
+    order, to ``output`` when given (and then not returned) or to the returned list.
+    """
+
+    loop = asyncio.get_running_loop()
+    queue: "asyncio.Queue[Optional[Tuple[int, RenderedPage]]]" = asyncio.Queue(maxsize=2 * concurrency)
+    pages: List[PageOCR] = []
+    deliver = pages.append if output is None else output.write_page
+    # Pages that finished ahead of an earlier, still-running page.
+    finished: Dict[int, PageOCR] = {}
+    next_index = 0
+
+    def release(page: PageOCR) -> None:
+        nonlocal next_index
+        finished[page.index] = page
+        while next_index in finished:
+            deliver(finished.pop(next_index))
+            next_index += 1
+
+    def dump_path(index: int) -> Optional[Path]:
+        if not dump_pages:
+            return None
+        path = output_dir / f"{pdf_path.stem}_page{index + 1:04d}.png"
+        if not dry_run:
+            return path
+        logger.debug("Dry-run: skipping page image dump for page %d (path would be %s).", index + 1, path)
+        return None
+
+    async def produce(renderer: ThreadPoolExecutor) -> None:
+        for index in range(target_count):
+            page = await loop.run_in_executor(
+                renderer,
+                _render_page_index,
+                doc,
+                index,
+                dpi,
+                dump_path(index),
+                png_fast,
+                skip_text_chars,
+            )
+            if isinstance(page, PageOCR):
+                release(page)
+            else:
+                await queue.put((index, page))
+        for _ in range(concurrency):
+            await queue.put(None)
+
+    async def consume() -> None:
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            index, page = item
+            release(await _ocr_rendered_page(engine, index, page))
+
+    # All MuPDF calls, PNG dumps included, run on the single render thread; the document
+    # is not thread-safe.
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="winocr-render") as renderer:
+        tasks = [asyncio.ensure_future(produce(renderer))]
+        tasks.extend(asyncio.ensure_future(consume()) for _ in range(concurrency))
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # A failed page stops the pipeline; the producer may be blocked on a full queue.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+    return pages
+
+
 def process_pdf(
     pdf_path: Path,
     output_dir: Path,
-    dpi: int,
+    dpi: Optional[int],
     max_pages: Optional[int],
     language_code: str,
     dump_pages: bool,
     dry_run: bool,
+    concurrency: int = OCR_CONCURRENCY,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+    output: Optional["OutputWriter"] = None,
+    png_fast: bool = False,
+    skip_text_chars: Optional[int] = None,
 ) -> Tuple[List[PageOCR], Optional[str]]:
-    """Render each page of the PDF and perform OCR."""
+    """Render each page of the PDF and perform OCR.
+
+    ``dpi=None`` chooses the DPI per page (see ``AUTO_DPI_MIN_PIXELS``).
+    Pass a long-lived ``loop`` to reuse it across documents; otherwise one is created for this call.
+    With ``output``, pages are written as they complete and the returned list is empty.
+    ``png_fast`` selects the faster, larger ``--dump-pages`` encoding. With ``skip_text_chars``,
+    pages carrying at least that many characters of embedded text use it instead of OCR.
+    """
 
     engine, resolved_lang, fallback_used = create_ocr_engine(language_code)
     logger.info(
         "Initialized OCR engine with language=%s (fallback used=%s).",
-        resolved_lang or _normalize_language_tag(language_code),
+        resolved_lang or "user profile default",
         fallback_used,
     )
+    if output is not None:
+        output.start(resolved_lang)
 
     try:
         doc = fitz.open(pdf_path)
@@ -545,42 +834,28 @@ def process_pdf(
 
         target_count = min(total_pages, max_pages) if max_pages else total_pages
         logger.info(
-            "Processing %d page(s) (of %d total) at %d DPI.",
+            "Processing %d page(s) (of %d total) at %s DPI, %d OCR worker(s).",
             target_count,
             total_pages,
-            dpi,
+            "auto" if dpi is None else dpi,
+            concurrency,
         )
         start_time = time.perf_counter()
-        pages: List[PageOCR] = []
-
-        for index in range(target_count):
-            page = doc.load_page(index)
-            page_start = time.perf_counter()
-            image = render_page_to_image(page, dpi)
-            ocr_result = run_async(_recognize_page_async(engine, image))
-            plain_text, line_data = extract_line_data(ocr_result)
-            pages.append(
-                PageOCR(
-                    index=index,
-                    width=image.width,
-                    height=image.height,
-                    lines=line_data,
-                    plain_text=plain_text,
-                )
-            )
-            page_elapsed = time.perf_counter() - page_start
-            logger.info("Page %d processed in %.2f seconds.", index + 1, page_elapsed)
-
-            if dump_pages and not dry_run:
-                image_path = output_dir / f"{pdf_path.stem}_page{index + 1:04d}.png"
-                image.save(image_path, format="PNG")
-                logger.debug("Dumped rendered page to %s.", image_path)
-            elif dump_pages and dry_run:
-                logger.debug(
-                    "Dry-run: skipping page image dump for page %d (path would be %s).",
-                    index + 1,
-                    output_dir / f"{pdf_path.stem}_page{index + 1:04d}.png",
-                )
+        driver = _process_pdf_async(
+            doc,
+            target_count,
+            engine,
+            dpi,
+            concurrency,
+            pdf_path,
+            output_dir,
+            dump_pages,
+            dry_run,
+            output,
+            png_fast,
+            skip_text_chars,
+        )
+        pages = asyncio.run(driver) if loop is None else loop.run_until_complete(driver)
 
         total_elapsed = time.perf_counter() - start_time
         logger.info("Completed OCR for %d page(s) in %.2f seconds.", target_count, total_elapsed)
@@ -589,6 +864,99 @@ def process_pdf(
         doc.close()
 
 
+def _dumps_indented(value: Any) -> str:
+    """Serialize like ``json.dumps(value, ensure_ascii=False, indent=2)``, with orjson when installed."""
+
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False, indent=2)
+
+
+class _StreamedFile:
+    """Text file written piece by piece whose final content is ``"".join(pieces).rstrip() + end``.
+
+    Content goes to a ``.part`` file that replaces the target only on :meth:`commit`.
+    """
+
+    def __init__(self, path: Path, end: str = "\n") -> None:
+        self.path = path
+        self._end = end
+        self._part = path.with_name(path.name + ".part")
+        self._handle = self._part.open("w", encoding="utf-8")
+        # Trailing whitespace is held back until more content follows it.
+        self._pending = ""
+
+    def write(self, text: str) -> None:
+        stripped = text.rstrip()
+        if stripped:
+            self._handle.write(self._pending + stripped)
+            self._pending = text[len(stripped):]
+        else:
+            self._pending += text
+
+    def commit(self) -> None:
+        self._handle.write(self._end)
+        self._handle.close()
+        self._part.replace(self.path)
+
+    def abort(self) -> None:
+        self._handle.close()
+        self._part.unlink(missing_ok=True)
+
+
+class OutputWriter:
+    """Write text/Markdown/layout outputs one page at a time, in page order.
+
+    Output matches ``build_text_output``, ``build_markdown_output`` and the indented layout
+    JSON, without keeping every page in memory. Call :meth:`close` once all pages are written,
+    or :meth:`abort` to discard partial files.
+    """
+
+    def __init__(self, pdf_path: Path, output_dir: Path, dpi: Optional[int], output_format: str, dump_pages: bool) -> None:
+        self._pdf_path = pdf_path
+        self._dpi = dpi
+        base_name = pdf_path.stem
+        self._text = _StreamedFile(output_dir / f"{base_name}.txt") if output_format in {"text", "both"} else None
+        self._markdown = _StreamedFile(output_dir / f"{base_name}.md") if output_format in {"md", "both"} else None
+        self._layout = _StreamedFile(output_dir / f"{base_name}_layout.json", end="") if dump_pages else None
+        self._count = 0
+
+    def start(self, resolved_language: Optional[str]) -> None:
+        """Write the layout JSON prelude; the language is known once the engine exists."""
+
+        if self._layout is not None:
+            prelude = _dumps_indented(build_layout_payload([], self._dpi, self._pdf_path, resolved_language))
+            # Everything up to the empty "pages" list; page objects are appended after it.
+            self._layout.write(prelude[: prelude.rindex("[]")] + "[")
+
+    def write_page(self, page: PageOCR) -> None:
+        first = self._count == 0
+        if self._text is not None:
+            self._text.write(("" if first else "\n") + _text_block(page))
+        if self._markdown is not None:
+            self._markdown.write(("" if first else "\n\n") + _markdown_block(page))
+        if self._layout is not None:
+            self._layout.write(array_item(_dumps_indented(_layout_page(page)), 2, first))
+        self._count += 1
+
+    def close(self) -> None:
+        if self._text is not None:
+            self._text.commit()
+            logger.info("Wrote text output to %s.", self._text.path)
+        if self._markdown is not None:
+            self._markdown.commit()
+            logger.info("Wrote Markdown output to %s.", self._markdown.path)
+        if self._layout is not None:
+            self._layout.write(array_end(self._count, 2) + "\n}")
+            self._layout.commit()
+            logger.info("Wrote layout JSON to %s.", self._layout.path)
+
+    def abort(self) -> None:
+        for stream in (self._text, self._markdown, self._layout):
+            if stream is not None:
+                stream.abort()
+
+
 def write_outputs(
     pdf_path: Path,
     output_dir: Path,
@@ -600,68 +968,115 @@ def write_outputs(
 ) -> None:
     """Persist outputs in the requested formats."""
 
-    base_name = pdf_path.stem
-    if output_format in {"text", "both"}:
-        txt_path = output_dir / f"{base_name}.txt"
-        text_content = build_text_output(pages)
-        txt_path.write_text(text_content, encoding="utf-8")
-        logger.info("Wrote text output to %s.", txt_path)
-
-    if output_format in {"md", "both"}:
-        md_path = output_dir / f"{base_name}.md"
-        md_content = build_markdown_output(pages)
-        md_path.write_text(md_content, encoding="utf-8")
-        logger.info("Wrote Markdown output to %s.", md_path)
+    writer = OutputWriter(pdf_path, output_dir, dpi, output_format, dump_pages)
+    try:
+        writer.start(resolved_language)
+        for page in pages:
+            writer.write_page(page)
+    except BaseException:
+        writer.abort()
+        raise
+    writer.close()
 
-    if dump_pages:
-        layout_path = output_dir / f"{base_name}_layout.json"
-        layout_payload = build_layout_payload(pages, dpi, pdf_path, resolved_language)
-        layout_path.write_text(json.dumps(layout_payload, ensure_ascii=False, indent=2), encoding="utf-8")
-        logger.info("Wrote layout JSON to %s.", layout_path)
 
+def _process_one(pdf_path: Path, output_dir: Path, args: argparse.Namespace) -> int:
+    """Process a single PDF and write its outputs; returns the exit code.
 
-def main(argv: Optional[Sequence[str]] = None) -> int:
-    """CLI entry point."""
+    Also the worker function when several PDFs run in parallel, so it sets up WinRT itself.
+    """
 
-    args = parse_args(argv)
-    configure_logging(args.verbose)
+    dpi = None if args.auto_dpi else args.dpi
+    # One event loop per PDF; WinRT completions keep landing on the same loop.
+    loop = asyncio.new_event_loop()
     try:
         ensure_environment()
-        pdf_path, output_dir = resolve_paths(args.input, args.outdir, create_output_dir=not args.dry_run)
-        pages, resolved_lang = process_pdf(
-            pdf_path=pdf_path,
-            output_dir=output_dir,
-            dpi=args.dpi,
-            max_pages=args.max_pages,
-            language_code=args.lang,
-            dump_pages=args.dump_pages,
-            dry_run=args.dry_run,
-        )
-        if args.dry_run:
-            logger.info("Dry-run mode enabled; skipping write of output files.")
-        else:
-            write_outputs(
+        # Outputs are streamed page by page; nothing is written in dry-run mode.
+        output = None
+        if not args.dry_run:
+            output = OutputWriter(pdf_path, output_dir, dpi, args.fmt, args.dump_pages)
+        try:
+            process_pdf(
                 pdf_path=pdf_path,
                 output_dir=output_dir,
-                pages=pages,
-                resolved_language=resolved_lang,
-                dpi=args.dpi,
-                output_format=args.fmt,
+                dpi=dpi,
+                max_pages=args.max_pages,
+                language_code=args.lang,
                 dump_pages=args.dump_pages,
+                dry_run=args.dry_run,
+                concurrency=args.concurrency,
+                loop=loop,
+                output=output,
+                png_fast=args.png_fast,
+                skip_text_chars=args.skip_text_pages,
             )
+        except BaseException:
+            if output is not None:
+                output.abort()
+            raise
+        if output is None:
+            logger.info("Dry-run mode enabled; skipping write of output files.")
+        else:
+            output.close()
     except OCRToolError as exc:
         logger.error("%s", exc)
         return exc.exit_code
     except Exception as exc:  # pragma: no cover - unexpected failure
         logger.exception("Unexpected error: %s", exc)
         return 1
-    logger.info("OCR extraction finished successfully.")
+    finally:
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
     return 0
 
 
+def _process_many(pdf_paths: List[Path], output_dir: Path, args: argparse.Namespace) -> int:
+    """Spread PDFs over ``args.jobs`` worker processes; returns the first non-zero exit code."""
+
+    workers = min(args.jobs, len(pdf_paths))
+    logger.info("Processing %d PDF(s) with %d worker process(es).", len(pdf_paths), workers)
+    exit_codes = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=configure_logging, initargs=(args.verbose,)) as pool:
+        futures = [pool.submit(_process_one, pdf_path, output_dir, args) for pdf_path in pdf_paths]
+        for pdf_path, future in zip(pdf_paths, futures):
+            try:
+                exit_code = future.result()
+            except Exception as exc:  # pragma: no cover - worker process died
+                logger.error("Worker failed on %s: %s", pdf_path, exc)
+                exit_code = 1
+            if exit_code:
+                logger.error("Failed to process %s (exit code %d).", pdf_path, exit_code)
+            exit_codes.append(exit_code)
+    failed = sum(1 for exit_code in exit_codes if exit_code)
+    logger.info("Processed %d PDF(s); %d failed.", len(pdf_paths), failed)
+    return next((exit_code for exit_code in exit_codes if exit_code), 0)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """CLI entry point."""
+
+    args = parse_args(argv)
+    configure_logging(args.verbose)
+    try:
+        # Checked once up front so a broken setup is not reported by every worker.
+        ensure_environment()
+        pdf_paths, output_dir = resolve_paths(args.input, args.outdir, create_output_dir=not args.dry_run)
+    except OCRToolError as exc:
+        logger.error("%s", exc)
+        return exc.exit_code
+
+    if len(pdf_paths) == 1:
+        exit_code = _process_one(pdf_paths[0], output_dir, args)
+    else:
+        exit_code = _process_many(pdf_paths, output_dir, args)
+    if exit_code == 0:
+        logger.info("OCR extraction finished successfully.")
+    return exit_code
+
+
 if __name__ == "__main__":
     if len(sys.argv) == 1:
         print("Sample usage:")
         print(r'  python winocr_pdf.py -i "C:\\path\\doc.pdf" --lang ko-KR --dpi 300 -o .\\out --fmt both')
         print(r'  python winocr_pdf.py -i "C:\\path\\doc.pdf" --lang en-US --fmt text --dump-pages')
+        print(r'  python winocr_pdf.py -i "C:\\path\\scans" --jobs 4 -o .\\out')
     sys.exit(main())